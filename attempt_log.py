@@ -0,0 +1,155 @@
+"""
+Append-only JSONL log of quiz answers plus streaming per-question analytics.
+
+    python attempt_log.py                      # summarise the default log
+    python attempt_log.py day1.jsonl day2.jsonl --csv summary.csv
+"""
+import argparse
+import csv
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".wavelab", "quiz_attempts.jsonl")
+
+_FLUSH = object()
+_CLOSE = object()
+
+
+class AttemptLog:
+    """
+    Buffers answer events and appends them to a JSONL file from a background
+    thread, in batches of batch_size or once the oldest buffered event is
+    flush_interval seconds old, whichever comes first.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, batch_size=50, flush_interval=2.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._thread = None
+
+    def record(self, event):
+        # Never blocks the UI; the writer thread starts on first use
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="attempt-log", daemon=True)
+            self._thread.start()
+        self._queue.put(event)
+
+    def flush(self):
+        if self._thread is not None:
+            done = threading.Event()
+            self._queue.put((_FLUSH, done))
+            done.wait(timeout=5.0)
+
+    def close(self):
+        if self._thread is not None:
+            self._queue.put((_CLOSE, None))
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def _write(self, batch):
+        if not batch:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(event, separators=(",", ":")) + "\n" for event in batch))
+        batch.clear()
+
+    def _run(self):
+        batch = []
+        deadline = None  # when the oldest buffered event is flush_interval old
+        while True:
+            timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+            if isinstance(item, tuple) and item[0] in (_FLUSH, _CLOSE):
+                self._write(batch)
+                deadline = None
+                if item[0] is _CLOSE:
+                    return
+                item[1].set()
+                continue
+            if item is not None:
+                if not batch:
+                    deadline = time.monotonic() + self.flush_interval
+                batch.append(item)
+            if len(batch) >= self.batch_size or (deadline is not None and time.monotonic() >= deadline):
+                self._write(batch)
+                deadline = None
+
+
+def iter_attempts(paths):
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A torn last line from a crash should not stop the report
+                    continue
+
+
+def aggregate(paths):
+    """
+    One streaming pass over the logs; returns question id -> stats with
+    attempts, correct, accuracy and mean/min/max answer time in ms.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    stats = {}
+    for event in iter_attempts(paths):
+        qid = event.get("question_id")
+        if qid is None:
+            continue
+        s = stats.get(qid)
+        if s is None:
+            s = stats[qid] = {"level": event.get("level"), "topic": event.get("topic"),
+                              "attempts": 0, "correct": 0, "total_ms": 0.0,
+                              "min_ms": float("inf"), "max_ms": 0.0}
+        ms = float(event.get("answer_ms", 0.0))
+        s["attempts"] += 1
+        s["correct"] += bool(event.get("correct"))
+        s["total_ms"] += ms
+        s["min_ms"] = min(s["min_ms"], ms)
+        s["max_ms"] = max(s["max_ms"], ms)
+
+    for s in stats.values():
+        s["accuracy"] = s["correct"] / s["attempts"]
+        s["mean_ms"] = s.pop("total_ms") / s["attempts"]
+    return stats
+
+
+SUMMARY_FIELDS = ("question_id", "level", "topic", "attempts", "correct", "accuracy",
+                  "mean_ms", "min_ms", "max_ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-question accuracy from quiz attempt logs")
+    parser.add_argument("logs", nargs="*", default=[DEFAULT_PATH])
+    parser.add_argument("--csv", help="write the summary to this CSV file instead of stdout")
+    args = parser.parse_args(argv)
+
+    stats = aggregate(args.logs)
+    out = open(args.csv, "w", newline="") if args.csv else sys.stdout
+    try:
+        writer = csv.writer(out)
+        writer.writerow(SUMMARY_FIELDS)
+        for qid in sorted(stats):
+            s = stats[qid]
+            writer.writerow([qid, s["level"], s["topic"], s["attempts"], s["correct"],
+                             f"{s['accuracy']:.3f}", f"{s['mean_ms']:.0f}",
+                             f"{s['min_ms']:.0f}", f"{s['max_ms']:.0f}"])
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
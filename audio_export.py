@@ -0,0 +1,36 @@
+import wave
+
+import numpy as np
+
+import wave_engine
+
+CHUNK_FRAMES = 8192
+SAMPLE_RATES = (22050, 44100, 48000)
+
+
+def synth_chunks(freqs, amps, codes, sample_rate=44100, duration=5.0, chunk_frames=CHUNK_FRAMES):
+    """
+    Yield the superposition heard at x = 0 as float chunks in [-1, 1].
+
+    Memory stays bounded by chunk_frames no matter how long the render is.
+    The mix is scaled by the summed amplitudes so it can never clip.
+    """
+    total = int(round(duration * sample_rate))
+    peak = float(np.sum(np.abs(amps))) or 1.0
+    for start in range(0, total, chunk_frames):
+        # Integer sample indices keep the phase exact across chunk boundaries
+        t = np.arange(start, min(start + chunk_frames, total)) / sample_rate
+        yield wave_engine.displacement(0.0, t, freqs, amps, codes).sum(axis=0) / peak
+
+
+def export_wav(path, freqs, amps, codes, sample_rate=44100, duration=5.0, chunk_frames=CHUNK_FRAMES):
+    """Write a 16-bit mono WAV of the wave set; returns the number of frames written."""
+    frames = 0
+    with wave.open(str(path), "wb") as out:
+        out.setnchannels(1)
+        out.setsampwidth(2)
+        out.setframerate(sample_rate)
+        for chunk in synth_chunks(freqs, amps, codes, sample_rate, duration, chunk_frames):
+            out.writeframes(np.round(chunk * 32767).astype("<i2").tobytes())
+            frames += len(chunk)
+    return frames
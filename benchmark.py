@@ -0,0 +1,389 @@
+"""
+Headless benchmarks for the wave render path.
+
+    python benchmark.py -o bench_results.json
+    python benchmark.py --baseline bench_results.json
+
+Every target renders against a StubCanvas that records calls instead of
+drawing, so no display is needed. With --marshal, coordinates and pixel
+data are also passed through a Tcl interpreter the way tkinter would, so
+vector and raster backends pay their Python-to-Tcl conversion cost.
+
+    python benchmark.py --targets draw_all_waves raster --marshal
+"""
+import argparse
+from collections import Counter
+import itertools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import tkinter as tk
+
+import numpy as np
+
+from sim_hub import SimulationHub
+from wave_sim import WaveSimulator
+
+
+_tcl = None
+
+
+def marshal(*args):
+    # Convert arguments to Tcl objects as a real widget command would
+    global _tcl
+    if _tcl is None:
+        _tcl = tk.Tcl()
+    _tcl.call("list", *args)
+
+
+class StubCanvas:
+    """
+    Records canvas calls and pushed coordinates; draws nothing. Calls are
+    also added to tk.calls when given the simulator's TclCallCounter.
+    """
+
+    marshal = False
+
+    def __init__(self, width=800, height=280, tk=None):
+        self.width = width
+        self.height = height
+        self.tk = tk
+        self.calls = Counter()
+        self.points = 0
+        self.items = {}
+        self._next_id = 1
+
+    def winfo_width(self):
+        self._count("winfo_width")
+        return self.width
+
+    def winfo_height(self):
+        self._count("winfo_height")
+        return self.height
+
+    def winfo_reqwidth(self):
+        return self.width
+
+    def _count(self, name):
+        self.calls[name] += 1
+        if self.tk is not None:
+            self.tk.calls += 1
+
+    def _new_item(self, kind, args, kw):
+        self._count("create_" + kind)
+        item = self._next_id
+        self._next_id += 1
+        tags = kw.get("tags", ())
+        self.items[item] = (kind, (tags,) if isinstance(tags, str) else tuple(tags))
+        if kind == "line":
+            self.points += len(_flatten(args)) // 2
+            if self.marshal:
+                marshal(*_flatten(args))
+        return item
+
+    def create_line(self, *args, **kw):
+        return self._new_item("line", args, kw)
+
+    def create_text(self, *args, **kw):
+        return self._new_item("text", args, kw)
+
+    def create_image(self, *args, **kw):
+        return self._new_item("image", args, kw)
+
+    def _match(self, tag_or_id):
+        if tag_or_id == "all":
+            return list(self.items)
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        return [i for i, (_, tags) in self.items.items() if tag_or_id in tags]
+
+    def find_withtag(self, tag_or_id):
+        return tuple(self._match(tag_or_id))
+
+    def find_all(self):
+        return tuple(self.items)
+
+    def delete(self, *tags_or_ids):
+        self._count("delete")
+        for tag in tags_or_ids:
+            for item in self._match(tag):
+                del self.items[item]
+
+    def coords(self, item, *args):
+        self._count("coords")
+        self.points += len(_flatten(args)) // 2
+        if self.marshal:
+            marshal(*_flatten(args))
+
+    def itemconfig(self, item, **kw):
+        self._count("itemconfig")
+
+    def tag_lower(self, *args):
+        self._count("tag_lower")
+
+    def tag_raise(self, *args):
+        self._count("tag_raise")
+
+    def bind(self, *args, **kw):
+        pass
+
+
+class StubPhoto:
+    """Stands in for tk.PhotoImage; counts the pixel bytes pushed to it."""
+
+    def __init__(self, master=None, width=0, height=0):
+        self.tk = getattr(master, "tk", None)
+        self.bytes = 0
+
+    def configure(self, **kw):
+        pass
+
+    def put(self, data, **kw):
+        self.bytes += len(data)
+        if self.tk is not None:
+            self.tk.calls += 1
+        if StubCanvas.marshal:
+            marshal(data)
+
+
+def _flatten(args):
+    if len(args) == 1 and isinstance(args[0], (list, tuple)):
+        return args[0]
+    return args
+
+
+def make_headless_simulator(width=800, height=280, hub=None):
+    # Tk variables only need a Tcl interpreter, not a display
+    sim = WaveSimulator.__new__(WaveSimulator)
+    sim.master = None
+    sim.hub = hub
+    sim.tk = tk.Tcl().tk
+    sim.init_state()
+    if hub is None or hub.views == [sim]:
+        sim.remove_all_waves()
+    sim.canvas = StubCanvas(width, height, sim.tk)
+    sim.photo_factory = StubPhoto
+    return sim
+
+
+def load_waves(sim, specs):
+    for freq, amp, wave_type in specs:
+        sim.add_wave(freq, amp, wave_type, "#e81ad7")
+    sim.sync_wave_items()
+    sim.draw_static_elements()
+
+
+# name -> setup(width, height, specs) returning (frame(t), canvas)
+TARGETS = {}
+# Targets drawing more than one view per frame; only compared with each other
+VIEW_COUNTS = {"views_shared": 2, "views_separate": 2}
+
+
+def target(name):
+    def register(setup):
+        TARGETS[name] = setup
+        return setup
+    return register
+
+
+def simulator_target(name, attr=None, value=None):
+    """Register a single-view target drawing with one simulator attribute or variable changed."""
+    def setup(width, height, specs):
+        sim = make_headless_simulator(width, height)
+        if attr is not None:
+            option = getattr(sim, attr)
+            if isinstance(option, tk.Variable):
+                option.set(value)
+            else:
+                setattr(sim, attr, value)
+        load_waves(sim, specs)
+
+        def frame(t):
+            sim.t = t
+            sim.draw_all_waves()
+        return frame, sim.canvas
+    TARGETS[name] = setup
+
+
+simulator_target("draw_all_waves")
+simulator_target("recreate", "reuse_wave_items", False)
+simulator_target("full_recompute", "scroll_render", False)
+simulator_target("raster", "render_backend", "raster")
+simulator_target("ripple", "view_mode", "ripple tank")
+
+
+@target("views_shared")
+def _views_shared(width, height, specs):
+    # Two views on one hub: samples are computed once per tick
+    hub = SimulationHub(None)
+    views = [make_headless_simulator(width, height, hub) for _ in range(2)]
+    load_waves(views[0], specs)
+
+    def frame(t):
+        for view in views:
+            view.t = t
+        hub.draw()
+    return frame, views[0].canvas
+
+
+@target("views_separate")
+def _views_separate(width, height, specs):
+    sims = [make_headless_simulator(width, height) for _ in range(2)]
+    for sim in sims:
+        load_waves(sim, specs)
+
+    def frame(t):
+        for sim in sims:
+            sim.t = t
+            sim.draw_all_waves()
+    return frame, sims[0].canvas
+
+
+@target("per_pixel")
+def _per_pixel(width, height, specs):
+    # The original loop: generate_wave_y for every pixel, then a fresh line
+    sim = make_headless_simulator(width, height)
+    load_waves(sim, specs)
+    canvas = sim.canvas
+
+    def frame(t):
+        canvas.delete("wave_frame")
+        for idx in range(len(sim.store)):
+            flat = []
+            for x in range(width + 1):
+                flat.extend((x, sim.generate_wave_y(x, t, idx)))
+            canvas.create_line(*flat, fill=sim.store.color_of(idx), width=2,
+                               tags=("wave", "wave_frame"), smooth=True)
+    return frame, canvas
+
+
+def run_case(setup, width, height, specs, frames, fps=60.0):
+    frame, canvas = setup(width, height, specs)
+    frame(0.0)  # warm-up
+    canvas.points = 0
+    latencies = np.empty(frames)
+    for i in range(frames):
+        start = time.perf_counter()
+        frame((i + 1) / fps)
+        latencies[i] = time.perf_counter() - start
+    points = canvas.points
+
+    # Separate short pass for memory; tracemalloc distorts timings
+    frame, canvas = setup(width, height, specs)
+    tracemalloc.start()
+    for i in range(min(frames, 5)):
+        frame((i + 1) / fps)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = latencies.sum()
+    return {
+        "frames": frames,
+        "mean_ms": float(latencies.mean() * 1000),
+        "p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "p99_ms": float(np.percentile(latencies, 99) * 1000),
+        "points_per_frame": points / frames,
+        "points_per_s": points / total if total > 0 else 0.0,
+        "peak_kib": peak / 1024,
+    }
+
+
+def case_key(result):
+    return (result["target"], result["waves"], result["wave_type"], result["freq"],
+            result["width"], result["height"])
+
+
+def sweep(targets, wave_counts, wave_types, freqs, widths, height=280, frames=60, log=None):
+    results = []
+    for name, n, wave_type, freq, width in itertools.product(
+            targets, wave_counts, wave_types, freqs, widths):
+        # Spread the frequencies a little so waves are not identical
+        specs = [(freq * (1 + 0.05 * i), 60.0, wave_type) for i in range(n)]
+        result = {"target": name, "waves": n, "wave_type": wave_type, "freq": freq,
+                  "width": width, "height": height}
+        result.update(run_case(TARGETS[name], width, height, specs, frames))
+        results.append(result)
+        if log:
+            log(f"{name:>15} waves={n:<3} {wave_type:<6} f={freq:<7g} w={width:<5} "
+                f"p50={result['p50_ms']:.2f}ms p99={result['p99_ms']:.2f}ms "
+                f"{result['points_per_s'] / 1e6:.2f}Mpts/s peak={result['peak_kib']:.0f}KiB")
+    return results
+
+
+def compare(results, baseline, tolerance=0.2):
+    """Return (key, ratio) for every case whose p50 regressed beyond tolerance."""
+    previous = {case_key(r): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = previous.get(case_key(result))
+        if old and old["p50_ms"] > 0:
+            ratio = result["p50_ms"] / old["p50_ms"]
+            if ratio > 1 + tolerance:
+                regressions.append((case_key(result), ratio))
+    return regressions
+
+
+def winners(results):
+    """
+    Fastest target by p50 for every scene that was run with several targets.
+    Single- and multi-view targets are ranked separately: (views, scene, best, group).
+    """
+    scenes = {}
+    for result in results:
+        views = VIEW_COUNTS.get(result["target"], 1)
+        scenes.setdefault((views, case_key(result)[1:]), []).append(result)
+    return [(views, scene, min(group, key=lambda r: r["p50_ms"]), group)
+            for (views, scene), group in scenes.items() if len(group) > 1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless WaveLab render benchmarks")
+    parser.add_argument("--targets", nargs="+", default=["draw_all_waves", "recreate"],
+                        choices=sorted(TARGETS))
+    parser.add_argument("--waves", nargs="+", type=int, default=[1, 8, 32])
+    parser.add_argument("--types", nargs="+", default=["sine", "square", "saw"])
+    parser.add_argument("--freqs", nargs="+", type=float, default=[2.0, 20.0, 1000.0])
+    parser.add_argument("--widths", nargs="+", type=int, default=[800, 1600, 3840])
+    parser.add_argument("--height", type=int, default=280)
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("-o", "--output", default="bench_results.json")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--marshal", action="store_true",
+                        help="pass coordinates and pixels through Tcl like a real canvas")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed p50 slowdown before a case counts as a regression")
+    args = parser.parse_args(argv)
+    StubCanvas.marshal = args.marshal
+
+    results = sweep(args.targets, args.waves, args.types, args.freqs, args.widths,
+                    args.height, args.frames, log=print)
+    report = {
+        "meta": {"python": platform.python_version(), "numpy": np.__version__,
+                 "marshal": args.marshal,
+                 "platform": platform.platform(), "created": time.time()},
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} cases to {args.output}")
+
+    for views, (n, wave_type, freq, width, height), best, group in winners(results):
+        others = ", ".join(f"{r['target']} x{r['p50_ms'] / best['p50_ms']:.1f}"
+                           for r in group if r is not best)
+        label = f" [{views} views]" if views > 1 else ""
+        print(f"waves={n:<3} {wave_type:<6} f={freq:<7g} {width}x{height}{label}: "
+              f"{best['target']} wins ({others})")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for key, ratio in regressions:
+            print(f"REGRESSION {key}: p50 x{ratio:.2f}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
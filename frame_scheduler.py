@@ -0,0 +1,71 @@
+import time
+
+import tick_service
+
+MAX_STEP = 0.25  # s; longer gaps (dialogs, window drags) are not replayed
+MAX_SKIP = 4     # never drop more than this many frames in a row
+
+
+class FrameScheduler:
+    """
+    Drives an animation from the wall clock on the shared tick service, so
+    it pauses by itself while the widget is not visible.
+
+    step(elapsed) is called every tick with the real seconds since the last
+    tick, so simulation time stays correct under load. draw() is skipped for
+    a few ticks whenever a frame costs more than the budget.
+    """
+
+    def __init__(self, widget, step, draw, target_fps=60, budget_ms=None):
+        self.widget = widget
+        self.step = step
+        self.draw = draw
+        self.target_fps = target_fps
+        self.budget_ms = budget_ms  # None means one frame period
+        self.running = False
+        self.frames = 0
+        self.dropped = 0
+        self._job = None
+        self._last = 0.0
+        self._skip = 0
+
+    @property
+    def period(self):
+        return 1.0 / max(self.target_fps, 1)
+
+    @property
+    def budget(self):
+        return self.budget_ms / 1000.0 if self.budget_ms else self.period
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self._last = time.perf_counter()
+        self._skip = 0
+        self._job = tick_service.register(self.widget, self._tick, self.period * 1000, delay_ms=0)
+
+    def stop(self):
+        self.running = False
+        if self._job is not None:
+            tick_service.unregister(self.widget, self._job)
+            self._job = None
+
+    def _tick(self):
+        now = time.perf_counter()
+        self.step(min(now - self._last, MAX_STEP))
+        self._last = now
+
+        if self._skip:
+            self._skip -= 1
+            self.dropped += 1
+        else:
+            self.draw()
+            self.frames += 1
+            cost = time.perf_counter() - now
+            if cost > self.budget:
+                self._skip = min(int(cost / self.budget), MAX_SKIP)
+
+        # The service keeps a frame-boundary grid; follow target_fps changes
+        if self._job is not None:
+            self._job.interval_ms = self.period * 1000
@@ -0,0 +1,97 @@
+from collections import namedtuple
+import threading
+import time
+
+import numpy as np
+
+import sampling
+import scrolling
+import wave_engine
+
+# frames is a list of (flat coords, smooth) per wave
+ComputedFrame = namedtuple("ComputedFrame", "t frames compute_ms")
+
+
+def compute_frame(width, height, t, freqs, amps, codes, rings=None):
+    """Tk-free coordinates for every wave; pass rings to use the scrolling render."""
+    if rings is None:
+        return [sampling.render_wave(width, height, t, freqs[idx], amps[idx], codes[idx])
+                for idx in range(len(freqs))]
+    while len(rings) < len(freqs):
+        rings.append(scrolling.ColumnRing())
+    return [scrolling.render_wave(rings[idx], width, height, t, freqs[idx], amps[idx], codes[idx])
+            for idx in range(len(freqs))]
+
+
+def compute_sum(width, height, t, freqs, amps, codes):
+    """Flat coordinates of the superposed waves, one point per pixel column."""
+    xs = np.arange(width + 1, dtype=float)
+    ys = height // 2 - wave_engine.displacement(xs, t, freqs, amps, codes).sum(axis=0)
+    return wave_engine.interleave(xs, ys)
+
+
+class FrameWorker:
+    """
+    Computes frames on a background thread with one pending and one ready slot.
+
+    submit() overwrites a request the worker has not started yet, and a
+    finished frame overwrites one the UI has not taken yet, so a slow
+    consumer only ever sees the newest frame and nothing queues up.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending = None
+        self._ready = None
+        self._thread = None
+        self._stopping = False
+        self._rings = []  # owned by the worker thread
+        self.dropped = 0
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="wave-frame-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def submit(self, width, height, t, freqs, amps, codes, scroll=True):
+        with self._cond:
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = (width, height, t, list(freqs), list(amps), list(codes), scroll)
+            self._cond.notify()
+
+    def take(self):
+        # Newest finished frame, or None if nothing new since the last call
+        with self._cond:
+            frame, self._ready = self._ready, None
+            return frame
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                width, height, t, freqs, amps, codes, scroll = self._pending
+                self._pending = None
+
+            start = time.perf_counter()
+            frames = compute_frame(width, height, t, freqs, amps, codes,
+                                   self._rings if scroll else None)
+            done = ComputedFrame(t, frames, (time.perf_counter() - start) * 1000)
+
+            with self._cond:
+                if self._ready is not None:
+                    self.dropped += 1
+                self._ready = done
@@ -1,7 +1,31 @@
+import json
+import os
+import sys
+import time
 import tkinter as tk
-from wave_sim import WaveSimulator
+
+import tick_service
+
+# Taken at import so the report covers Tk start-up as well
+START = time.perf_counter()
+STARTUP_LOG_ENV = "WAVELAB_STARTUP_LOG"  # append startup timings (JSON lines) to this file
+PREWARM_DELAY_MS = 300
+GLOW_MS = 320
+
+def report_startup(marks):
+    print("Startup: " + ", ".join(f"{name} {ms:.0f} ms" for name, ms in marks.items()), file=sys.stderr)
+    path = os.environ.get(STARTUP_LOG_ENV)
+    if path:
+        with open(path, "a") as f:
+            f.write(json.dumps({"ts": time.time(), **{k: round(v, 1) for k, v in marks.items()}}) + "\n")
 
 def main():
+    # Milliseconds since START for each startup milestone
+    startup = {}
+
+    def mark(name):
+        startup.setdefault(name, (time.perf_counter() - START) * 1000)
+
     root = tk.Tk()
     root.title("WaveLab: A Simulation-Based Learning Tool for Sound Waves")
     # Set initial size
@@ -96,14 +120,33 @@ def main():
     # Initial call after a short delay
     root.after(200, lambda: resize_welcome() if welcome_canvas.winfo_width() > 1 else None)
 
-    # Neon glow for title
+    # First paint: the idle pass right after the first Expose, which is when
+    # the canvas draws. Interactive: the event loop then gets back to events.
+    exposed = False
+
+    def on_first_expose(event=None):
+        # Mapping can deliver several Expose events in one batch; report once
+        nonlocal exposed
+        if exposed:
+            return
+        exposed = True
+        root.after_idle(lambda: (mark("first_paint"), root.after(1, on_interactive)))
+
+    def on_interactive():
+        mark("interactive")
+        report_startup(startup)
+        root.after(PREWARM_DELAY_MS, prewarm)
+
+    welcome_canvas.bind("<Expose>", on_first_expose, add="+")
+
+    # Neon glow for title; the tick service pauses it once the welcome
+    # screen is hidden
     def glow_welcome():
         current = welcome_canvas.itemcget(welcome_title, "fill")
         next_color = neon2 if current == neon1 else neon3 if current == neon2 else neon1
         welcome_canvas.itemconfig(welcome_title, fill=next_color)
-        root.after(320, glow_welcome)
 
-    glow_welcome()
+    tick_service.register(welcome_canvas, glow_welcome, GLOW_MS, delay_ms=0)
 
     # -------------------------------------------
     # MAIN SIMULATION FRAME
@@ -143,31 +186,43 @@ def main():
         current = title_canvas.itemcget(title, "fill")
         next_color = neon2 if current == neon1 else neon3 if current == neon2 else neon1
         title_canvas.itemconfig(title, fill=next_color)
-        root.after(320, glow)
 
     try:
         root.option_add("*Font", ("Segoe UI", 10))
     except:
         pass
 
-    sim = WaveSimulator(main_frame)  # Pass main_frame instead of root
+    # The simulator (and NumPy behind it) is imported and built only when
+    # needed, or pre-warmed once the welcome screen is idle
+    sim = None
+
+    def build_simulator():
+        nonlocal sim
+        if sim is None:
+            from sim_hub import SimulationHub
+            # Further views can be opened from the simulator and share this hub
+            sim = SimulationHub(main_frame).open_view()
+            mark("simulator_ready")
+        return sim
+
+    def prewarm():
+        if sim is None:
+            import sim_hub  # noqa: F401 - heavy imports first, widgets on the next idle pass
+            root.after_idle(build_simulator)
 
     def switch_to_main():
+        build_simulator()
         start_frame.pack_forget()
         main_frame.pack(fill="both", expand=True)
         resize_banner()
         sim.draw_static_elements()
         # Removed draw_all_waves from here to prevent initial lag; assume WaveSimulator handles its own animation
-        glow()  # Start glow for main title
-
-    def on_resize(event=None):
-        resize_banner()
-        sim.draw_static_elements()  # Force full redraw of grids/axes
-        # Removed draw_all_waves from resize to reduce lag; if WaveSimulator needs it, add back with throttling
+        # Start glow for main title, on the same ticks as any other 320 ms job
+        tick_service.register(title_canvas, glow, GLOW_MS, delay_ms=0)
 
-    # Bind resize to main_frame and root for maximize handling
-    main_frame.bind("<Configure>", on_resize)
-    root.bind("<Configure>", on_resize)  # Extra bind for window maximize/resize
+    # The simulator debounces its own canvas resizes; the banner only needs
+    # to follow its canvas
+    title_canvas.bind("<Configure>", resize_banner)
 
     root.mainloop()
 
@@ -0,0 +1,163 @@
+"""
+Offline rendering of the wave animation to numbered PNG/PPM frames.
+
+    python offline_render.py --wave sine:2:60 --wave square:3:40:#00e5ff \\
+        --end 60 --fps 60 --out frames/
+
+Frames are rasterized with NumPy using the same wave math as the simulator
+canvas, so no Tk window is needed. Every frame depends only on its index,
+so the output is byte-identical for any number of workers.
+"""
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import os
+import struct
+import zlib
+
+import numpy as np
+
+import sampling
+import wave_engine
+
+BACKGROUND = "#000000"
+GRID_COLOR = "#434040"
+AXIS_COLOR = "#3CCA45"
+LINE_WIDTH = 2
+FORMATS = ("png", "ppm")
+
+
+def parse_color(color):
+    color = color.lstrip("#")
+    return tuple(int(color[i:i + 2], 16) for i in (0, 2, 4))
+
+
+def background(width, height, show_grid=True):
+    """Return a (height, width) palette index image of the empty canvas."""
+    idx = np.zeros((height, width), dtype=np.uint16)
+    if show_grid:
+        idx[::50, :] = 1
+        idx[:, ::50] = 1
+    idx[height // 2, :] = 2
+    return idx
+
+
+def palette(colors):
+    # Index 0-2 are the background, grid and axis; wave i paints index 3 + i
+    return np.array([parse_color(c) for c in (BACKGROUND, GRID_COLOR, AXIS_COLOR, *colors)],
+                    dtype=np.uint8)
+
+
+def draw_waves(idx, t, freqs, amps, codes):
+    """Paint every wave into the palette index image idx in place."""
+    height, width = idx.shape
+    mid_y = height // 2
+    cols = np.arange(width)
+    half = LINE_WIDTH / 2
+    for i, (freq, amp, code) in enumerate(zip(freqs, amps, codes)):
+        # Exact min/max of the curve over each pixel column, so steep edges
+        # and dense high-frequency waves still come out as solid spans
+        wave_speed, k = wave_engine.wave_kinematics(freq)
+        lo, hi = sampling.column_envelope(cols - wave_speed * t, k, code)
+        top = np.clip(np.floor(mid_y - amp * hi - half), 0, height).astype(np.intp)
+        bottom = np.clip(np.ceil(mid_y - amp * lo + half), 0, height).astype(np.intp)
+        lengths = np.maximum(bottom - top, 0)
+        r0, r1 = int(top.min()), int(bottom.max())
+        if lengths.sum() * 4 > (r1 - r0) * width:
+            # Mostly solid band: mask just the rows the wave can reach
+            band = np.arange(r0, r1).reshape(-1, 1)
+            np.copyto(idx[r0:r1], 3 + i, where=(band >= top) & (band < bottom))
+        else:
+            # Thin curve: index only the covered pixels, span by span
+            starts = np.cumsum(lengths) - lengths
+            rows = np.repeat(top - starts, lengths) + np.arange(lengths.sum())
+            idx[rows, np.repeat(cols, lengths)] = 3 + i
+    return idx
+
+
+def rasterize_frame(width, height, t, freqs, amps, codes, colors, show_grid=True):
+    """Return an (height, width, 3) uint8 image of the canvas at time t."""
+    idx = draw_waves(background(width, height, show_grid), t, freqs, amps, codes)
+    return palette(colors)[idx]
+
+
+def encode_ppm(img):
+    height, width, _ = img.shape
+    return b"P6 %d %d 255\n" % (width, height) + img.tobytes()
+
+
+def _png_chunk(kind, data):
+    return (struct.pack(">I", len(data)) + kind + data
+            + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+
+def encode_png(img):
+    height, width, _ = img.shape
+    # Filter type 0 (none) in front of every scanline
+    raw = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    raw[:, 1:] = img.reshape(height, -1)
+    return (b"\x89PNG\r\n\x1a\n"
+            + _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + _png_chunk(b"IDAT", zlib.compress(raw.tobytes(), 6))
+            + _png_chunk(b"IEND", b""))
+
+
+def frame_time(index, start, fps):
+    # From the integer index, never by accumulating 1/fps
+    return start + index / fps
+
+
+def _render_one(index, out_dir, fmt, width, height, start, fps, freqs, amps, codes, colors, show_grid):
+    img = rasterize_frame(width, height, frame_time(index, start, fps),
+                          freqs, amps, codes, colors, show_grid)
+    data = encode_png(img) if fmt == "png" else encode_ppm(img)
+    path = os.path.join(out_dir, f"frame_{index:05d}.{fmt}")
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def render_sequence(out_dir, freqs, amps, codes, colors, start=0.0, end=5.0, fps=30,
+                    width=800, height=280, fmt="png", workers=None, show_grid=True, mp_context=None):
+    """
+    Render frames for [start, end) into out_dir; returns the written paths in order.
+    Pass a "spawn" mp_context when calling from a threaded GUI process.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {FORMATS}")
+    os.makedirs(out_dir, exist_ok=True)
+    count = int(round((end - start) * fps))
+    job = partial(_render_one, out_dir=out_dir, fmt=fmt, width=width, height=height,
+                  start=start, fps=fps, freqs=list(freqs), amps=list(amps),
+                  codes=list(codes), colors=list(colors), show_grid=show_grid)
+    if workers == 1:
+        return [job(i) for i in range(count)]
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        return list(pool.map(job, range(count), chunksize=max(1, count // 64)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render WaveLab frames without a window")
+    parser.add_argument("--wave", action="append", type=wave_engine.parse_wave_spec, required=True,
+                        help="type:freq:amp[:color], repeat for several waves")
+    parser.add_argument("--start", type=float, default=0.0)
+    parser.add_argument("--end", type=float, default=5.0)
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--width", type=int, default=800)
+    parser.add_argument("--height", type=int, default=280)
+    parser.add_argument("--format", choices=FORMATS, default="png")
+    parser.add_argument("--workers", type=int, default=None, help="default: one per CPU")
+    parser.add_argument("--no-grid", action="store_true")
+    parser.add_argument("--out", default="frames")
+    args = parser.parse_args(argv)
+
+    waves = args.wave
+    paths = render_sequence(args.out, [w["freq"] for w in waves], [w["amp"] for w in waves],
+                            [wave_engine.type_code(w["wave_type"]) for w in waves],
+                            [w["color"] for w in waves], args.start, args.end, args.fps,
+                            args.width, args.height, args.format, args.workers, not args.no_grid)
+    print(f"Wrote {len(paths)} frames to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""
+Parameter sweeps over superposed waves, with summary metrics per combination.
+
+    python param_sweep.py --waves 2 --freqs 1:20:1 -o pairs.csv
+    python param_sweep.py --waves 3 --freqs 1:5:0.5 --types sine square \\
+        --phases 0 1.5708 --duration 20 --workers 8 -o sweep.csv
+
+Every wave takes every value of --freqs, --amps, --types and --phases, so
+a sweep has (F * A * T * P) ** waves rows. The signal is the superposition
+at x = 0 over --duration seconds, using the simulator's wave definitions.
+Rows are written as chunks finish, so they are not in index order.
+
+Metrics: peak |y|, RMS, and the beat period 1 / (smallest non-zero
+frequency difference), empty when all frequencies are equal.
+"""
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import csv
+from functools import partial
+import io
+import os
+import sys
+
+import numpy as np
+
+import wave_engine
+
+CHUNK = 256
+METRICS = ("peak", "rms", "beat_period")
+
+
+def parse_values(values):
+    """Accept plain numbers and inclusive start:stop:step ranges."""
+    out = []
+    for value in values:
+        if ":" in value:
+            start, stop, step = (float(v) for v in value.split(":"))
+            if step <= 0:
+                raise ValueError(f"range step must be positive in {value!r}")
+            out.extend(np.round(np.arange(start, stop + step / 2, step), 10).tolist())
+        else:
+            out.append(float(value))
+    return out
+
+
+def grid_shape(axes, n_waves):
+    # Mixed-radix digits: (freq, amp, type, phase) for wave 1, then wave 2, ...
+    return tuple(len(axis) for axis in axes) * n_waves
+
+
+def decode(indices, axes, n_waves):
+    """Per-wave (freqs, amps, codes, phases) arrays of shape (len(indices), n_waves)."""
+    digits = np.unravel_index(indices, grid_shape(axes, n_waves))
+    return [np.stack([np.asarray(axis)[digits[4 * w + i]] for w in range(n_waves)], axis=1)
+            for i, axis in enumerate(axes)]
+
+
+def beat_periods(freqs):
+    diffs = np.abs(freqs[:, :, None] - freqs[:, None, :])
+    diffs = np.where(diffs > 1e-9, diffs, np.inf).min(axis=(1, 2))
+    return np.where(np.isfinite(diffs), 1.0 / diffs, np.nan)
+
+
+def evaluate(start, stop, axes, n_waves, duration, rate):
+    """Parameters and metrics for grid indices [start, stop)."""
+    indices = np.arange(start, stop)
+    freqs, amps, codes, phases = decode(indices, axes, n_waves)
+    t = np.arange(max(int(duration * rate), 1)) / rate
+    signal = np.zeros((len(indices), len(t)))
+    for w in range(n_waves):
+        signal += wave_engine.displacement(0.0, t, freqs[:, w], amps[:, w], codes[:, w], phases[:, w])
+    metrics = np.column_stack((np.abs(signal).max(axis=1), np.sqrt((signal ** 2).mean(axis=1)),
+                               beat_periods(freqs)))
+    return indices, freqs, amps, codes, phases, metrics
+
+
+def header(n_waves):
+    cols = ["index"]
+    for w in range(1, n_waves + 1):
+        cols += [f"wave{w}_type", f"wave{w}_freq", f"wave{w}_amp", f"wave{w}_phase"]
+    return cols + list(METRICS)
+
+
+def rows(result):
+    indices, freqs, amps, codes, phases, metrics = result
+    for r in range(len(indices)):
+        row = [int(indices[r])]
+        for w in range(freqs.shape[1]):
+            row += [wave_engine.WAVE_TYPES[codes[r, w]], f"{freqs[r, w]:g}",
+                    f"{amps[r, w]:g}", f"{phases[r, w]:g}"]
+        row += ["" if np.isnan(m) else f"{m:.6g}" for m in metrics[r]]
+        yield row
+
+
+def evaluate_csv(start, stop, axes, n_waves, duration, rate):
+    # Formatting happens in the worker, so the parent only appends text
+    buf = io.StringIO()
+    result = evaluate(start, stop, axes, n_waves, duration, rate)
+    csv.writer(buf).writerows(rows(result))
+    return len(result[0]), buf.getvalue()
+
+
+def sweep(out, axes, n_waves=2, duration=10.0, rate=400.0, workers=None, chunk=CHUNK, progress=None):
+    """Write one CSV row per grid point to out; returns the number of rows."""
+    total = int(np.prod(grid_shape(axes, n_waves)))
+    csv.writer(out).writerow(header(n_waves))
+    job = partial(evaluate_csv, axes=axes, n_waves=n_waves, duration=duration, rate=rate)
+    starts = iter(range(0, total, chunk))
+    done = 0
+    if workers == 1:
+        for start in starts:
+            count, text = job(start, min(start + chunk, total))
+            out.write(text)
+            done += count
+            if progress:
+                progress(done, total)
+        return done
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # A bounded window of chunks in flight keeps memory flat for huge grids
+        pending = set()
+        for start in starts:
+            pending.add(pool.submit(job, start, min(start + chunk, total)))
+            if len(pending) >= 2 * workers:
+                break
+        while pending:
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                count, text = future.result()
+                out.write(text)
+                done += count
+                start = next(starts, None)
+                if start is not None:
+                    pending.add(pool.submit(job, start, min(start + chunk, total)))
+            if progress:
+                progress(done, total)
+    return done
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep superposed-wave parameters and tabulate metrics")
+    parser.add_argument("--waves", type=int, default=2, help="waves per combination")
+    parser.add_argument("--freqs", nargs="+", default=["1:20:1"], help="Hz; values or start:stop:step")
+    parser.add_argument("--amps", nargs="+", default=["60"], help="px; values or start:stop:step")
+    parser.add_argument("--types", nargs="+", default=["sine"], choices=wave_engine.WAVE_TYPES)
+    parser.add_argument("--phases", nargs="+", default=["0"], help="radians; values or start:stop:step")
+    parser.add_argument("--duration", type=float, default=10.0, help="s of signal per combination")
+    parser.add_argument("--rate", type=float, default=400.0, help="samples per second")
+    parser.add_argument("--workers", type=int, default=None, help="default: one per CPU")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="combinations per task")
+    parser.add_argument("-o", "--output", default="-", help="file, or - for stdout")
+    args = parser.parse_args(argv)
+    if args.waves < 1 or args.chunk < 1:
+        parser.error("--waves and --chunk must be positive")
+    try:
+        axes = (parse_values(args.freqs), parse_values(args.amps),
+                [wave_engine.type_code(t) for t in args.types], parse_values(args.phases))
+    except ValueError as e:
+        parser.error(str(e))
+
+    def progress(done, total):
+        print(f"\r{done}/{total} combinations", end="", file=sys.stderr)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        sweep(out, axes, args.waves, args.duration, args.rate, args.workers, args.chunk,
+              progress if args.output != "-" else None)
+    finally:
+        if args.output != "-":
+            out.close()
+            print(file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import csv
+import json
+import time
+
+import numpy as np
+
+FIELDS = ("timestamp", "compute_ms", "canvas_ms", "frame_ms", "points", "tk_calls", "items")
+
+
+class TclCallCounter:
+    """
+    Stands in for a widget's Tcl interpreter and counts the round trips made
+    through it: commands and variable reads and writes.
+    """
+
+    def __init__(self, tk):
+        self._tk = tk
+        self.calls = 0
+
+    def __getattr__(self, name):
+        return getattr(self._tk, name)
+
+    def call(self, *args):
+        self.calls += 1
+        return self._tk.call(*args)
+
+    def globalgetvar(self, *args):
+        self.calls += 1
+        return self._tk.globalgetvar(*args)
+
+    def globalsetvar(self, *args):
+        self.calls += 1
+        return self._tk.globalsetvar(*args)
+
+
+class FrameStats:
+    """Fixed-size ring buffer of per-frame timings and counters."""
+
+    def __init__(self, capacity=600):
+        self.capacity = capacity
+        self._data = np.zeros((capacity, len(FIELDS)))
+        self._next = 0
+        self.count = 0
+
+    def record(self, compute_ms, canvas_ms, points, tk_calls, items):
+        row = self._data[self._next]
+        row[:] = (time.perf_counter(), compute_ms, canvas_ms, compute_ms + canvas_ms,
+                  points, tk_calls, items)
+        self._next = (self._next + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def clear(self):
+        self._next = 0
+        self.count = 0
+
+    def rows(self):
+        # Oldest first
+        if self.count < self.capacity:
+            return self._data[:self.count]
+        return np.roll(self._data, -self._next, axis=0)
+
+    def summary(self):
+        data = self.rows()
+        if len(data) == 0:
+            return {"frames": 0, "fps": 0.0, "p50_ms": 0.0, "p99_ms": 0.0,
+                    "points_per_frame": 0.0, "tk_calls_per_frame": 0.0, "items": 0}
+        span = data[-1, 0] - data[0, 0]
+        frame_ms = data[:, 3]
+        return {
+            "frames": len(data),
+            "fps": float((len(data) - 1) / span) if span > 0 else 0.0,
+            "p50_ms": float(np.percentile(frame_ms, 50)),
+            "p99_ms": float(np.percentile(frame_ms, 99)),
+            "points_per_frame": float(data[:, 4].mean()),
+            "tk_calls_per_frame": float(data[:, 5].mean()),
+            "items": int(data[-1, 6]),
+        }
+
+    def hud_text(self):
+        s = self.summary()
+        return (f"{s['fps']:.0f} fps  |  p50 {s['p50_ms']:.1f} ms  p99 {s['p99_ms']:.1f} ms  |  "
+                f"{s['points_per_frame']:.0f} pts/frame")
+
+    def export(self, path):
+        # Format follows the file extension: .json, anything else is CSV
+        data = self.rows()
+        if str(path).lower().endswith(".json"):
+            with open(path, "w") as f:
+                json.dump({"summary": self.summary(),
+                           "frames": [dict(zip(FIELDS, row)) for row in data.tolist()]}, f, indent=2)
+        else:
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(FIELDS)
+                writer.writerows(data.tolist())
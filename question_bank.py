@@ -0,0 +1,55 @@
+import json
+import os
+import random
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "questions.json")
+
+# (path, mtime) -> parsed index, shared by every QuestionBank on that file
+_cache = {}
+
+
+class QuestionBank:
+    """
+    Quiz questions from a JSON file, indexed by level and by (level, topic).
+
+    Nothing is read until the first lookup, and a parsed file is reused until
+    it changes on disk.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+
+    def _index(self):
+        key = (os.path.abspath(self.path), os.path.getmtime(self.path))
+        index = _cache.get(key)
+        if index is None:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            by_level, by_topic = {}, {}
+            for q in data["questions"]:
+                by_level.setdefault(q["level"], []).append(q)
+                by_topic.setdefault((q["level"], q.get("topic")), []).append(q)
+            index = {"levels": data.get("levels", list(by_level)),
+                     "by_level": by_level, "by_topic": by_topic}
+            _cache[key] = index
+        return index
+
+    def levels(self):
+        return list(self._index()["levels"])
+
+    def topics(self, level):
+        return sorted(topic for lvl, topic in self._index()["by_topic"] if lvl == level and topic)
+
+    def count(self, level, topic=None):
+        return len(self._pool(level, topic))
+
+    def _pool(self, level, topic=None):
+        index = self._index()
+        if topic is None:
+            return index["by_level"].get(level, [])
+        return index["by_topic"].get((level, topic), [])
+
+    def draw(self, level, n, topic=None):
+        # For large pools random.sample picks by index, without copying or shuffling
+        pool = self._pool(level, topic)
+        return random.sample(pool, min(n, len(pool)))
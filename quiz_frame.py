@@ -1,13 +1,23 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
 import random
+import time
+import uuid
+
+from attempt_log import AttemptLog
+from question_bank import QuestionBank
 
 class QuizFrame(ttk.Frame):
     def __init__(self, master):
         super().__init__(master)
         self.master = master
         self.levels = ["Easy", "Average", "Hard"]  # Changed "Medium" to "Average"
-        self.questions_by_level = self.build_questions()
+        # Parsed lazily on the first Start Level, then cached
+        self.bank = QuestionBank()
+        self.questions_per_level = 10
+        self.attempt_log = AttemptLog()
+        self.session_id = uuid.uuid4().hex
+        self.asked_at = 0.0
         self.level_var = tk.StringVar(value=self.levels[0])
         self.current_q = None
         self.q_index = 0
@@ -15,195 +25,9 @@ class QuizFrame(ttk.Frame):
         self.total = 0
         self.create_widgets()
 
-    def build_questions(self):
-        return {
-            "Easy": [
-                {"text": "Which variable controls the height of the wave?",
-                 "choices": [("Frequency", "A", "Frequency changes how fast the wave oscillates."),
-                             ("Amplitude", "B", "Amplitude controls the height of the wave."),
-                             ("Phase", "C", "Phase shifts the wave position."),
-                             ("Wavelength", "D", "Wavelength is related to frequency and speed.")],
-                 "correct": "B"},
-                {"text": "Which wave type is smooth and periodic?",
-                 "choices": [("Sine", "A", "Sine wave is smooth and periodic."),
-                             ("Square", "B", "Square wave has abrupt changes."),
-                             ("Saw", "C", "Saw wave ramps linearly."),
-                             ("Triangle", "D", "Triangle wave is piecewise linear.")],
-                 "correct": "A"},
-                {"text": "What does frequency measure?",
-                 "choices": [("Wave height", "A", "Height is amplitude."),
-                             ("Oscillations per second", "B", "Frequency is in Hz, measuring cycles per second."),
-                             ("Wave speed", "C", "Speed is separate from frequency."),
-                             ("Wave color", "D", "Color is for visualization.")],
-                 "correct": "B"},
-                {"text": "A higher amplitude means?",
-                 "choices": [("Faster wave", "A", "Speed is not amplitude."),
-                             ("Louder sound", "B", "Higher amplitude corresponds to louder volume."),
-                             ("More cycles", "C", "Cycles are frequency."),
-                             ("Shorter wavelength", "D", "Wavelength depends on frequency.")],
-                 "correct": "B"},
-                {"text": "What is a sound wave?",
-                 "choices": [("Light wave", "A", "Light is electromagnetic."),
-                             ("Mechanical wave", "B", "Sound requires a medium like air."),
-                             ("Radio wave", "C", "Radio is electromagnetic."),
-                             ("Static wave", "D", "Static is not a wave type.")],
-                 "correct": "B"},
-                {"text": "Which tool simulates waves?",
-                 "choices": [("Calculator", "A", "Not for waves."),
-                             ("WaveLab", "B", "WaveLab is designed for wave simulations."),
-                             ("Paint app", "C", "Not for physics."),
-                             ("Spreadsheet", "D", "Not interactive for waves.")],
-                 "correct": "B"},
-                {"text": "What unit is frequency in?",
-                 "choices": [("Meters", "A", "Length unit."),
-                             ("Hertz", "B", "Hz measures cycles per second."),
-                             ("Seconds", "C", "Time unit."),
-                             ("Volts", "D", "Electrical unit.")],
-                 "correct": "B"},
-                {"text": "Amplitude affects what?",
-                 "choices": [("Speed", "A", "Speed is constant."),
-                             ("Loudness", "B", "Higher amplitude means louder sound."),
-                             ("Frequency", "C", "Frequency is separate."),
-                             ("Direction", "D", "Direction is not affected.")],
-                 "correct": "B"},
-                {"text": "A sine wave looks like?",
-                 "choices": [("Square", "A", "Square is blocky."),
-                             ("Smooth curve", "B", "Sine is a smooth sinusoidal curve."),
-                             ("Ramp", "C", "Ramp is sawtooth."),
-                             ("Flat line", "D", "Flat is no oscillation.")],
-                 "correct": "B"},
-                {"text": "What is interference?",
-                 "choices": [("Wave addition", "A", "Waves combine in interference."),
-                             ("Wave speed", "B", "Not directly."),
-                             ("Wave color", "C", "Visualization only."),
-                             ("Wave type", "D", "Type is sine/square/etc.")],
-                 "correct": "A"}
-            ],
-            "Average": [
-                {"text": "Increasing frequency does what?",
-                 "choices": [("Increases height", "A", "Height is amplitude."),
-                             ("Speeds oscillation", "B", "Higher frequency means faster cycles."),
-                             ("Slows wave", "C", "Frequency doesn't slow speed."),
-                             ("Changes color", "D", "Color is arbitrary.")],
-                 "correct": "B"},
-                {"text": "Which wave has abrupt jumps?",
-                 "choices": [("Sine", "A", "Smooth."),
-                             ("Square", "B", "Square jumps between levels."),
-                             ("Saw", "C", "Ramp shape."),
-                             ("Triangle", "D", "Smooth transitions.")],
-                 "correct": "B"},
-                {"text": "If amplitude doubles, height?",
-                 "choices": [("Halves", "A", "Opposite."),
-                             ("Doubles", "B", "Directly proportional."),
-                             ("Stays same", "C", "No change."),
-                             ("Quadruples", "D", "Not squared.")],
-                 "correct": "B"},
-                {"text": "Speed slider affects?",
-                 "choices": [("Frequency", "A", "Separate."),
-                             ("Animation speed", "B", "Controls how fast time advances."),
-                             ("Amplitude", "C", "Not amplitude."),
-                             ("Wave type", "D", "Type is fixed.")],
-                 "correct": "B"},
-                {"text": "What is wavelength?",
-                 "choices": [("Wave height", "A", "Height is amplitude."),
-                             ("Distance per cycle", "B", "Wavelength is the length of one cycle."),
-                             ("Time per cycle", "C", "That's period."),
-                             ("Wave speed", "D", "Speed is separate.")],
-                 "correct": "B"},
-                {"text": "Interference can create?",
-                 "choices": [("Louder waves", "A", "Constructive interference."),
-                             ("Quieter waves", "B", "Destructive interference."),
-                             ("Faster waves", "C", "Not speed."),
-                             ("Both A and B", "D", "Depending on phase.")],
-                 "correct": "D"},
-                {"text": "A 1000 Hz wave has?",
-                 "choices": [("Low pitch", "A", "High frequency is high pitch."),
-                             ("High pitch", "B", "1000 Hz is audible high pitch."),
-                             ("No sound", "C", "It's audible."),
-                             ("Slow oscillation", "D", "Fast oscillation.")],
-                 "correct": "B"},
-                {"text": "Wave speed depends on?",
-                 "choices": [("Frequency", "A", "Speed is medium-dependent."),
-                             ("Medium", "B", "Speed varies by material."),
-                             ("Amplitude", "C", "Amplitude doesn't affect speed."),
-                             ("Color", "D", "Visualization.")],
-                 "correct": "B"},
-                {"text": "What is resonance?",
-                 "choices": [("Wave reflection", "A", "Not exactly."),
-                             ("Amplified oscillation", "B", "Resonance amplifies at natural frequency."),
-                             ("Wave absorption", "C", "Opposite."),
-                             ("Wave splitting", "D", "Not splitting.")],
-                 "correct": "B"},
-                {"text": "Doubling frequency halves?",
-                 "choices": [("Amplitude", "A", "No."),
-                             ("Wavelength", "B", "Wavelength = speed / frequency."),
-                             ("Speed", "C", "Speed constant."),
-                             ("Period", "D", "Period = 1/frequency.")],
-                 "correct": "B"}
-            ],
-            "Hard": [
-                {"text": "For a traveling wave, phase is?",
-                 "choices": [("2*pi*f*t", "A", "Missing spatial part."),
-                             ("k*x - 2*pi*f*t", "B", "Standard form for right-moving wave."),
-                             ("Amplitude only", "C", "Not just amplitude."),
-                             ("Random", "D", "Deterministic.")],
-                 "correct": "B"},
-                {"text": "In WaveLab, high frequency shows?",
-                 "choices": [("Slow waves", "A", "Opposite."),
-                             ("Dense oscillations", "B", "Visual density for high freq."),
-                             ("Flat line", "C", "No."),
-                             ("Large amplitude", "D", "Separate.")],
-                 "correct": "B"},
-                {"text": "Sound speed in air is ~?",
-                 "choices": [("300 m/s", "A", "Close, but 343 m/s."),
-                             ("343 m/s", "B", "Standard value."),
-                             ("1000 m/s", "C", "Too fast."),
-                             ("10 m/s", "D", "Too slow.")],
-                 "correct": "B"},
-                {"text": "Interference patterns depend on?",
-                 "choices": [("Amplitude", "A", "Also phase."),
-                             ("Phase difference", "B", "Key for interference."),
-                             ("Frequency", "C", "Also matters."),
-                             ("All of the above", "D", "Multiple factors.")],
-                 "correct": "D"},
-                {"text": "A square wave's Fourier series has?",
-                 "choices": [("Only even harmonics", "A", "Odd harmonics."),
-                             ("Only odd harmonics", "B", "Square wave has odd harmonics."),
-                             ("No harmonics", "C", "It does."),
-                             ("Infinite harmonics", "D", "Yes, but odd.")],
-                 "correct": "B"},
-                {"text": "Wavelength formula is?",
-                 "choices": [("f / v", "A", "No."),
-                             ("v / f", "B", "Wavelength = speed / frequency."),
-                             ("f * v", "C", "No."),
-                             ("a / f", "D", "Amplitude not involved.")],
-                 "correct": "B"},
-                {"text": "Resonance occurs at?",
-                 "choices": [("Any frequency", "A", "Specific."),
-                             ("Natural frequency", "B", "Matches the system's frequency."),
-                             ("Low amplitude", "C", "Opposite."),
-                             ("High speed", "D", "Not necessarily.")],
-                 "correct": "B"},
-                {"text": "Doppler effect changes?",
-                 "choices": [("Amplitude", "A", "Not primarily."),
-                             ("Frequency", "B", "Frequency shifts with motion."),
-                             ("Wavelength", "C", "Related to frequency."),
-                             ("Both B and C", "D", "Frequency and wavelength.")],
-                 "correct": "D"},
-                {"text": "A wave's energy is proportional to?",
-                 "choices": [("Frequency", "A", "Not directly."),
-                             ("Amplitude squared", "B", "Energy ~ A^2."),
-                             ("Speed", "C", "Not squared."),
-                             ("Wavelength", "D", "Inverse.")],
-                 "correct": "B"},
-                {"text": "In standing waves, nodes are?",
-                 "choices": [("High amplitude", "A", "Opposite."),
-                             ("Zero displacement", "B", "Points of no motion."),
-                             ("Antinodes", "C", "Antinodes are max."),
-                             ("Moving points", "D", "Nodes are stationary.")],
-                 "correct": "B"}
-            ]
-        }
+    def destroy(self):
+        self.attempt_log.close()
+        super().destroy()
 
     def create_widgets(self):
         self.config(height=180)
@@ -224,6 +48,17 @@ class QuizFrame(ttk.Frame):
 
         self.choice_frame = ttk.Frame(self)
         self.choice_frame.pack(fill="x", pady=(0, 5))
+        # Allocated once and relabelled for every question
+        self.choice_buttons = [ttk.Button(self.choice_frame) for _ in range(4)]
+        self.shown_choices = 0
+
+        # Inline, non-modal feedback so the simulation keeps animating
+        self.feedback_var = tk.StringVar(value="")
+        self.feedback_label = ttk.Label(self, textvariable=self.feedback_var, anchor="w",
+                                        justify="left", font=("Segoe UI", 10))
+        self.feedback_label.pack(fill="x", pady=(0, 5))
+        self.feedback_label.bind("<Configure>",
+                                 lambda e: self.feedback_label.config(wraplength=max(e.width - 10, 100)))
 
         bottom = ttk.Frame(self)
         bottom.pack(fill="x")
@@ -242,59 +77,82 @@ class QuizFrame(ttk.Frame):
 
     def start_level(self):
         level = self.level_var.get()
-        self.questions = list(self.questions_by_level[level])
-        random.shuffle(self.questions)
+        self.questions = self.bank.draw(level, self.questions_per_level)
         self.score = 0
         self.total = len(self.questions)
         self.q_index = 0
         self.next_btn.config(state="disabled")
         self.ask_question()
 
-    def clear_question_area(self):
+    def set_question_text(self, text):
         self.q_text.config(state="normal")
         self.q_text.delete("1.0", "end")
+        self.q_text.insert("1.0", text)
         self.q_text.config(state="disabled")
-        for widget in self.choice_frame.winfo_children():
-            widget.destroy()
+
+    def show_choices(self, count):
+        # Grow the pool only if a question ever has more choices than before
+        while len(self.choice_buttons) < count:
+            self.choice_buttons.append(ttk.Button(self.choice_frame))
+        if count == self.shown_choices:
+            return
+        for btn in self.choice_buttons:
+            btn.pack_forget()
+        for btn in self.choice_buttons[:count]:
+            btn.pack(fill="x", pady=3)
+        self.shown_choices = count
+
+    def show_feedback(self, text, color="#222222"):
+        self.feedback_label.config(foreground=color)
+        self.feedback_var.set(text)
+
+    def clear_question_area(self):
+        self.set_question_text("")
+        self.show_choices(0)
+        self.show_feedback("")
 
     def ask_question(self):
-        self.clear_question_area()
         if self.q_index >= len(self.questions):
             self.finish_quiz()
             return
 
         q = self.questions[self.q_index]
         self.current_q = q
-        self.q_text.config(state="normal")
-        self.q_text.insert("1.0", f"Q{self.q_index + 1}: {q['text']}")
-        self.q_text.config(state="disabled")
+        self.set_question_text(f"Q{self.q_index + 1}: {q['text']}")
+        self.show_feedback("")
 
         choices = list(q["choices"])
         random.shuffle(choices)
 
-        for idx, choice in enumerate(choices):
+        self.show_choices(len(choices))
+        for idx, (btn, choice) in enumerate(zip(self.choice_buttons, choices)):
             key = chr(65 + idx)
-            btn = ttk.Button(self.choice_frame, text=f"{key}. {choice[0]}",
-                             command=lambda c=choice: self.select_choice(c))
-            btn.pack(fill="x", pady=3)
+            btn.config(text=f"{key}. {choice[0]}", state="normal",
+                       command=lambda c=choice: self.select_choice(c))
 
         self.next_btn.config(state="disabled")
+        self.asked_at = time.perf_counter()
 
     def select_choice(self, choice):
-        for child in self.choice_frame.winfo_children():
-            child.config(state="disabled")
+        for btn in self.choice_buttons[:self.shown_choices]:
+            btn.config(state="disabled")
 
         clicked = choice[1]
         correct = self.current_q["correct"]
+        self.attempt_log.record({
+            "ts": time.time(), "session": self.session_id,
+            "question_id": self.current_q.get("id"), "level": self.current_q.get("level"),
+            "topic": self.current_q.get("topic"), "choice": clicked, "correct": clicked == correct,
+            "answer_ms": round((time.perf_counter() - self.asked_at) * 1000),
+        })
 
         if clicked == correct:
             self.score += 1
-            messagebox.showinfo("Correct", "Correct!\n\n" + choice[2])
+            self.show_feedback("Correct! " + choice[2], "#1a7f37")
         else:
             correct_text = next(c[0] for c in self.current_q["choices"] if c[1] == correct)
             correct_expl = next(c[2] for c in self.current_q["choices"] if c[1] == correct)
-            messagebox.showinfo("Incorrect",
-                                f"Incorrect.\n\nCorrect answer: {correct_text}\n\n{correct_expl}")
+            self.show_feedback(f"Incorrect. Correct answer: {correct_text}. {correct_expl}", "#c62828")
 
         self.q_index += 1
         self.update_score_label()
@@ -315,12 +173,12 @@ class QuizFrame(ttk.Frame):
         else:
             msg += "\nTry again!"
 
-        messagebox.showinfo("Level Complete", msg)
         self.score = 0
         self.total = 0
         self.q_index = 0
         self.update_score_label()
         self.clear_question_area()
+        self.show_feedback(msg)
         self.next_btn.config(state="disabled")
 
     def update_score_label(self):
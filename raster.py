@@ -0,0 +1,51 @@
+"""
+Raster backend for the wave canvas.
+
+All waves are painted into one NumPy pixel buffer with the offline
+renderer and pushed to a single PhotoImage as packed PPM rows, so a frame
+costs one photo update however many points the curves would need.
+"""
+import tkinter as tk
+
+import offline_render
+
+BACKENDS = ("vector", "raster")
+
+
+class RasterLayer:
+    def __init__(self, canvas, photo_factory=tk.PhotoImage):
+        self.canvas = canvas
+        self.photo_factory = photo_factory
+        self.photo = None
+        self.item = None
+        self.size = None
+        self.bytes = 0
+        self._background = None
+        self._background_key = None
+        self._palette = None
+        self._palette_key = None
+
+    def render(self, width, height, t, freqs, amps, codes, colors, show_grid=True):
+        # The grid and axis are copied from a cached background each frame
+        key = (width, height, show_grid)
+        if key != self._background_key:
+            self._background_key = key
+            self._background = offline_render.background(width, height, show_grid)
+        colors = tuple(colors)
+        if colors != self._palette_key:
+            self._palette_key = colors
+            self._palette = offline_render.palette(colors)
+        idx = offline_render.draw_waves(self._background.copy(), t, freqs, amps, codes)
+        return self._palette[idx]
+
+    def show(self, img):
+        height, width, _ = img.shape
+        if self.photo is None:
+            self.photo = self.photo_factory(master=self.canvas, width=width, height=height)
+            self.item = self.canvas.create_image(0, 0, anchor="nw", image=self.photo, tags="raster")
+        elif self.size != (width, height):
+            self.photo.configure(width=width, height=height)
+        self.size = (width, height)
+        data = offline_render.encode_ppm(img)
+        self.photo.put(data)
+        self.bytes = len(data)
@@ -0,0 +1,95 @@
+"""
+2-D ripple tank: circular waves from point sources, superposed over a grid.
+
+Source i emits wave i (cycling through the wave list), so with a single
+wave every source is coherent and the classic interference fringes appear.
+The field is computed on a coarse grid of cell x cell pixel blocks and
+drawn as a heat map.
+"""
+import math
+
+import numpy as np
+
+import wave_engine
+
+MIN_CELL = 2
+MAX_CELL = 16
+ATTENUATION_PX = 120.0  # amplitude falls off as 1/sqrt(1 + r/ATTENUATION_PX)
+NEGATIVE = (0x00, 0xE5, 0xFF)
+POSITIVE = (0xE8, 0x1A, 0xD7)
+
+
+def heat_lut():
+    # 256 colours from cyan (trough) through black to magenta (crest)
+    ramp = np.abs(np.linspace(-1.0, 1.0, 256)).reshape(-1, 1)
+    lut = np.where(np.arange(256).reshape(-1, 1) < 128, NEGATIVE, POSITIVE) * ramp
+    return lut.astype(np.uint8)
+
+
+class RippleTank:
+    def __init__(self, cell=4):
+        self.cell = cell
+        # Positions are fractions of the canvas size, so a resize keeps the layout
+        self.sources = [[1 / 3, 0.5], [2 / 3, 0.5]]
+        self.cost_ms = 0.0
+        self._tables = {}  # source index -> (key, distance, weight)
+        self._lut = heat_lut()
+
+    def grid_shape(self, width, height):
+        return math.ceil(width / self.cell), math.ceil(height / self.cell)
+
+    def nearest(self, x, y, width, height):
+        return min(range(len(self.sources)),
+                   key=lambda i: (self.sources[i][0] * width - x) ** 2 + (self.sources[i][1] * height - y) ** 2)
+
+    def move_source(self, idx, x, y, width, height):
+        self.sources[idx] = [min(max(x / width, 0.0), 1.0), min(max(y / height, 0.0), 1.0)]
+
+    def tables(self, idx, width, height):
+        """Distance (px) and attenuation from source idx to every cell centre, cached."""
+        fx, fy = self.sources[idx]
+        key = (width, height, self.cell, fx, fy)
+        cached = self._tables.get(idx)
+        if cached is None or cached[0] != key:
+            cols, rows = self.grid_shape(width, height)
+            xs = (np.arange(cols) + 0.5) * self.cell - fx * width
+            ys = (np.arange(rows) + 0.5) * self.cell - fy * height
+            distance = np.hypot(xs.reshape(1, -1), ys.reshape(-1, 1))
+            weight = 1.0 / np.sqrt(1.0 + distance / ATTENUATION_PX)
+            cached = self._tables[idx] = (key, distance, weight)
+        return cached[1], cached[2]
+
+    def field(self, width, height, t, freqs, amps, codes):
+        """Superposed displacement on the grid, scaled to [-1, 1]."""
+        cols, rows = self.grid_shape(width, height)
+        total = np.zeros((rows, cols))
+        if not len(freqs):
+            return total
+        scale = 0.0
+        for idx in range(len(self.sources)):
+            w = idx % len(freqs)
+            distance, weight = self.tables(idx, width, height)
+            wave_speed, k = wave_engine.wave_kinematics(freqs[w])
+            total += (amps[w] * weight) * wave_engine.waveform(k * (distance - wave_speed * t), codes[w])
+            scale += amps[w]
+        return total / scale
+
+    def render(self, width, height, t, freqs, amps, codes):
+        """Return an (height, width, 3) uint8 heat map with the sources marked."""
+        values = self.field(width, height, t, freqs, amps, codes)
+        idx = np.clip((values + 1.0) * 127.5, 0, 255).astype(np.uint8)
+        img = self._lut[idx].repeat(self.cell, axis=0).repeat(self.cell, axis=1)[:height, :width]
+        for fx, fy in self.sources:
+            x, y = int(fx * (width - 1)), int(fy * (height - 1))
+            img[max(y - 2, 0):y + 3, max(x - 2, 0):x + 3] = 255
+        return img
+
+    def adapt(self, cost_ms, budget_ms):
+        # Coarser cells when frames run over budget, finer when there is room
+        self.cost_ms = 0.8 * self.cost_ms + 0.2 * cost_ms if self.cost_ms else cost_ms
+        if self.cost_ms > budget_ms and self.cell < MAX_CELL:
+            self.cell += 1
+            self.cost_ms = 0.0
+        elif self.cost_ms < budget_ms * 0.4 and self.cell > MIN_CELL:
+            self.cell -= 1
+            self.cost_ms = 0.0
@@ -0,0 +1,130 @@
+from collections import namedtuple
+import math
+
+import numpy as np
+
+import wave_engine
+from wave_engine import SINE, SQUARE
+
+# Level-of-detail knobs, all in screen pixels
+SAMPLES_PER_CYCLE = 24      # sine samples per on-screen wavelength
+MIN_SPACING = 1.0           # never sample finer than one pixel column
+SMOOTH_SPACING = 3.0        # Tk spline smoothing only pays off above this spacing
+ENVELOPE_WAVELENGTH = 4.0   # below this the wave is denser than the pixel grid
+
+# mode is "curve" (uniform samples), "edges" (exact square/saw vertices)
+# or "envelope" (min/max per pixel column); step is the curve spacing in px
+SamplePlan = namedtuple("SamplePlan", "mode step smooth")
+
+
+def screen_wavelength(freq):
+    _, k = wave_engine.wave_kinematics(freq)
+    return 2 * math.pi / float(k)
+
+
+def plan_wave(freq, code):
+    wavelength = screen_wavelength(freq)
+    if wavelength < ENVELOPE_WAVELENGTH:
+        return SamplePlan("envelope", MIN_SPACING, False)
+    if code != SINE:
+        # Square and saw are piecewise linear, so their corners are exact
+        return SamplePlan("edges", None, False)
+    step = max(wavelength / SAMPLES_PER_CYCLE, MIN_SPACING)
+    return SamplePlan("curve", step, step > SMOOTH_SPACING)
+
+
+def curve_points(width, t, freq, code, step):
+    n = int(math.ceil(width / step)) + 1
+    xs = np.linspace(0.0, width, n)
+    wave_speed, k = wave_engine.wave_kinematics(freq)
+    return xs, wave_engine.waveform(k * (xs - wave_speed * t), code)
+
+
+def edge_points(width, t, freq, code):
+    wave_speed, k = wave_engine.wave_kinematics(freq)
+    shift = wave_speed * t
+    # Square flips sign every half cycle, saw wraps once per cycle
+    jump = math.pi if code == SQUARE else 2 * math.pi
+    first = math.floor(k * (0 - shift) / jump) + 1
+    last = math.ceil(k * (width - shift) / jump)
+    ns = np.arange(first, last)
+    xd = ns * jump / k + shift
+
+    if code == SQUARE:
+        after = np.where(ns % 2 == 0, 1.0, -1.0)
+        before = -after
+    else:
+        after = np.full(len(ns), -1.0)
+        before = np.ones(len(ns))
+
+    # Evaluate the ends just inside the canvas so a jump landing exactly on
+    # an edge takes the value of the visible side
+    ends = wave_engine.waveform(k * (np.array([0.0, width]) - shift) + np.array([1e-9, -1e-9]), code)
+    xs = np.concatenate(([0.0], np.repeat(xd, 2), [float(width)]))
+    vals = np.empty(len(xs))
+    vals[0], vals[-1] = ends
+    vals[1:-1:2] = before
+    vals[2:-1:2] = after
+    return xs, vals
+
+
+def _contains(phase0, span, target, period):
+    # Does [phase0, phase0 + span] hit target + n * period for some n?
+    return np.mod(target - phase0, period) <= span
+
+
+def column_envelope(u0, k, code):
+    """Unit-wave (lo, hi) over one-pixel columns starting at co-moving positions u0."""
+    phase0 = k * u0
+    span = float(k)  # phase covered by one pixel column
+    two_pi = 2 * math.pi
+
+    if span >= two_pi:
+        return np.full(len(u0), -1.0), np.ones(len(u0))
+    if code == SINE:
+        v0, v1 = np.sin(phase0), np.sin(phase0 + span)
+        lo = np.where(_contains(phase0, span, 1.5 * math.pi, two_pi), -1.0, np.minimum(v0, v1))
+        hi = np.where(_contains(phase0, span, 0.5 * math.pi, two_pi), 1.0, np.maximum(v0, v1))
+    elif code == SQUARE:
+        flips = _contains(phase0, span, 0.0, math.pi)
+        v = wave_engine.waveform(phase0 + span / 2, SQUARE)
+        lo = np.where(flips, -1.0, v)
+        hi = np.where(flips, 1.0, v)
+    else:
+        p0 = np.mod(phase0 / two_pi, 1.0)
+        wraps = p0 + span / two_pi >= 1.0
+        lo = np.where(wraps, -1.0, 2 * (p0 - 0.5))
+        hi = np.where(wraps, 1.0, 2 * (p0 + span / two_pi - 0.5))
+    return lo, hi
+
+
+def envelope_band(cols, lo, hi):
+    # Alternate lo/hi order per column so consecutive segments trace a band
+    odd = (np.asarray(cols) % 2).astype(bool)
+    vals = np.empty(2 * len(lo))
+    vals[0::2] = np.where(odd, hi, lo)
+    vals[1::2] = np.where(odd, lo, hi)
+    return vals
+
+
+def envelope_points(width, t, freq, code):
+    wave_speed, k = wave_engine.wave_kinematics(freq)
+    cols = np.arange(max(int(width), 1))
+    lo, hi = column_envelope(cols - wave_speed * t, k, code)
+    return np.repeat(cols + 0.5, 2), envelope_band(cols, lo, hi)
+
+
+def wave_points(plan, width, t, freq, code):
+    """Unit-amplitude (xs, values) for one wave following its sample plan."""
+    if plan.mode == "envelope":
+        return envelope_points(width, t, freq, code)
+    if plan.mode == "edges":
+        return edge_points(width, t, freq, code)
+    return curve_points(width, t, freq, code, plan.step)
+
+
+def render_wave(width, height, t, freq, amp, code):
+    """Return (flat coords, smooth) for one wave, ready for canvas.coords()."""
+    plan = plan_wave(freq, code)
+    xs, vals = wave_points(plan, width, t, freq, code)
+    return wave_engine.interleave(xs, (height // 2) - amp * vals), plan.smooth
@@ -0,0 +1,42 @@
+import json
+import os
+
+import wave_engine
+
+VERSION = 1
+PRESETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "presets")
+
+
+def make_scenario(waves, speed=1.0, show_grid=True):
+    """waves: dicts with wave_type, freq, amp and color, as plain values."""
+    return {"version": VERSION, "speed": float(speed), "show_grid": bool(show_grid),
+            "waves": [{"wave_type": w["wave_type"], "freq": float(w["freq"]),
+                       "amp": float(w["amp"]), "color": w["color"]} for w in waves]}
+
+
+def validate(data):
+    if not isinstance(data, dict) or not isinstance(data.get("waves"), list):
+        raise ValueError("not a WaveLab scenario: missing wave list")
+    if data.get("version", VERSION) > VERSION:
+        raise ValueError(f"scenario version {data['version']} is newer than this WaveLab")
+    waves = []
+    for idx, w in enumerate(data["waves"]):
+        try:
+            wave = {"wave_type": w.get("wave_type", "sine"), "freq": float(w["freq"]),
+                    "amp": float(w["amp"]), "color": w.get("color", "#e81ad7")}
+        except (AttributeError, KeyError, TypeError, ValueError):
+            raise ValueError(f"wave {idx + 1} needs numeric freq and amp")
+        if wave["wave_type"] not in wave_engine.WAVE_TYPES or wave["freq"] <= 0 or wave["amp"] <= 0:
+            raise ValueError(f"wave {idx + 1} has an unknown type or a non-positive freq/amp")
+        waves.append(wave)
+    return make_scenario(waves, data.get("speed", 1.0), data.get("show_grid", True))
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        return validate(json.load(f))
+
+
+def save(path, scenario):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(scenario, f, indent=1)
@@ -0,0 +1,93 @@
+import math
+
+import numpy as np
+
+import sampling
+import wave_engine
+
+
+class ColumnRing:
+    """
+    Ring buffer of one wave's samples on a fixed lattice in its co-moving
+    frame u = x - wave_speed * t.
+
+    Every wave here travels rigidly, so a lattice value never changes once
+    computed; each frame only the lattice points newly scrolled into view
+    have to be evaluated. A parameter change (new key) starts over.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.values = None
+        self.lo = 0  # valid lattice range is [lo, hi)
+        self.hi = 0
+        self.computed = 0  # lattice points evaluated by the last window() call
+
+    def _segments(self, a, b):
+        # Ring slices holding lattice points [a, b): one, or two if it wraps
+        cap = len(self.values)
+        start = a % cap
+        if start + (b - a) <= cap:
+            return [(slice(start, start + b - a), slice(0, b - a))]
+        first = cap - start
+        return [(slice(start, cap), slice(0, first)), (slice(0, b - a - first), slice(first, b - a))]
+
+    def _store(self, a, b, sample):
+        for ring_part, sample_part in self._segments(a, b):
+            self.values[ring_part] = sample[sample_part]
+
+    def window(self, j0, j1, key, fill):
+        n = j1 - j0
+        if (key != self.key or self.values is None or len(self.values) < n
+                or j1 <= self.lo or j0 >= self.hi):
+            self.key = key
+            sample = fill(np.arange(j0, j1))
+            # A little headroom so small width changes do not force a reset
+            self.values = np.empty((n + 64,) + sample.shape[1:])
+            self._store(j0, j1, sample)
+            self.lo, self.hi = j0, j1
+            self.computed = n
+            return sample
+
+        self.computed = 0
+        for a, b in ((j0, self.lo), (self.hi, j1)):
+            if a < b:
+                self._store(a, b, fill(np.arange(a, b)))
+                self.computed += b - a
+        # Re-base: anything outside the window may now be overwritten
+        self.lo, self.hi = j0, j1
+        segments = self._segments(j0, j1)
+        if len(segments) == 1:
+            return self.values[segments[0][0]]
+        return np.concatenate([self.values[ring_part] for ring_part, _ in segments])
+
+
+def render_wave(ring, width, height, t, freq, amp, code):
+    """Scrolling counterpart of sampling.render_wave, reusing ring between frames."""
+    plan = sampling.plan_wave(freq, code)
+    if plan.mode == "edges":
+        # Exact corners are already proportional to the visible cycles
+        ring.computed = 0
+        return sampling.render_wave(width, height, t, freq, amp, code)
+
+    wave_speed, k = wave_engine.wave_kinematics(freq)
+    shift = float(wave_speed * t)
+    mid_y = height // 2
+
+    if plan.mode == "envelope":
+        # Lattice j is the one-pixel column [j, j + 1) in the co-moving frame
+        j0 = math.floor(-shift)
+        j1 = math.ceil(width - shift) + 1
+        bands = ring.window(j0, j1, (freq, code, "envelope"), lambda js: np.column_stack(
+            sampling.column_envelope(js.astype(float), k, code)))
+        js = np.arange(j0, j1)
+        xs = np.repeat(js + 0.5 + shift, 2)
+        vals = sampling.envelope_band(js, bands[:, 0], bands[:, 1])
+    else:
+        step = plan.step
+        j0 = math.floor(-shift / step)
+        j1 = math.ceil((width - shift) / step) + 1
+        vals = ring.window(j0, j1, (freq, code, step),
+                           lambda js: wave_engine.waveform(k * js * step, code))
+        xs = np.arange(j0, j1) * step + shift
+    return wave_engine.interleave(xs, mid_y - amp * vals), plan.smooth
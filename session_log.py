@@ -0,0 +1,225 @@
+"""
+Record a WaveSimulator session as a compact JSONL event log and replay it
+headless as a repeatable performance case.
+
+    python session_log.py classroom.jsonl
+    python session_log.py classroom.jsonl --json report.json
+    python session_log.py classroom.jsonl --baseline report.json --repeat 7
+
+The first line holds the starting state (canvas size, waves, settings).
+Every later line is one event with its time in seconds since recording
+started. Frames are not logged: while running, the replay draws frames at
+the recorded target FPS between events, as fast as it can, so a log
+always produces the same sequence of frames. Ripple-tank cell sizes come
+from the log rather than from the replay's own timings.
+
+The log is replayed --repeat times and each frame keeps its fastest time,
+so one noisy run does not trip the --baseline gate.
+"""
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from ripple_tank import RippleTank
+
+VERSION = 1
+RECORDED_SETTINGS = ("speed", "show_grid", "scroll_render", "threaded_render",
+                     "render_backend", "view_mode", "target_fps")
+REPLAY_MAX_FPS = 240
+REPEAT = 5
+
+
+class SessionRecorder:
+    def __init__(self):
+        self.events = []
+        self.size = None  # last canvas size logged
+        self._start = None
+
+    def start(self, state):
+        self._start = time.perf_counter()
+        self.events = [{"type": "header", "version": VERSION, **state}]
+
+    def log(self, kind, **data):
+        self.events.append({"t": round(time.perf_counter() - self._start, 4), "type": kind, **data})
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for event in self.events:
+                f.write(json.dumps(event, separators=(",", ":")) + "\n")
+
+
+def load(path):
+    with open(path, encoding="utf-8") as f:
+        events = [json.loads(line) for line in f if line.strip()]
+    if not events or events[0].get("type") != "header":
+        raise ValueError(f"{path} is not a WaveLab session log")
+    if events[0].get("version", VERSION) > VERSION:
+        raise ValueError(f"session log version {events[0]['version']} is newer than this WaveLab")
+    return events
+
+
+def apply_setting(sim, name, value):
+    if name == "threaded_render":
+        return  # worker threads would make frame costs depend on scheduling
+    getattr(sim, name).set(value)
+    if name == "target_fps":
+        sim.scheduler.target_fps = value
+    elif name in ("render_backend", "view_mode"):
+        sim.apply_backend()
+    elif name == "show_grid":
+        sim.draw_static_elements()
+
+
+def ripple_tank(sim):
+    if sim.ripple is None:
+        sim.ripple = RippleTank()
+    return sim.ripple
+
+
+def apply_event(sim, event):
+    kind = event["type"]
+    if kind == "add_waves":
+        sim.add_waves(event["waves"], replace=event.get("replace", False))
+    elif kind == "clear":
+        sim.remove_all_waves()
+        sim.t = 0.0
+        sim.waves_changed()
+    elif kind == "update_wave":
+        sim.store.update(event["idx"], **{event["name"]: event["value"]})
+        sim.draw_static_elements()
+        if not sim.running:
+            sim.draw_all_waves()
+    elif kind == "set_time":
+        sim.t = event["value"]
+    elif kind == "reset_time":
+        sim.t = 0.0
+        sim.draw_static_elements()
+        sim.draw_all_waves()
+    elif kind == "resize":
+        sim.canvas.width, sim.canvas.height = event["width"], event["height"]
+        sim.draw_static_elements()
+        if not sim.running:
+            sim.draw_all_waves()
+    elif kind == "ripple_cell":
+        ripple_tank(sim).cell = event["cell"]
+    elif kind == "move_source" and sim.ripple is not None:
+        w, h = sim.canvas.width, sim.canvas.height
+        sim.ripple.move_source(event["idx"], event["x"], event["y"], w, h)
+        if not sim.running:
+            sim.draw_all_waves()
+    elif kind == "setting":
+        apply_setting(sim, event["name"], event["value"])
+    elif kind in ("start", "stop"):
+        sim.running = kind == "start"
+
+
+def replay(events):
+    """Re-execute a session on a stub canvas; returns (frame session times, FrameStats rows)."""
+    from benchmark import make_headless_simulator
+    from perf_stats import FrameStats
+
+    header = events[0]
+    sim = make_headless_simulator(header["width"], header["height"])
+    duration = events[-1]["t"] if len(events) > 1 else 0.0
+    sim.stats = FrameStats(capacity=int(duration * REPLAY_MAX_FPS) + len(events) + 16)
+    sim.t = header.get("sim_t", 0.0)
+    sim.adapt_ripple = False
+    if header.get("ripple_cell"):
+        ripple_tank(sim).cell = header["ripple_cell"]
+        sim.ripple.sources = [list(s) for s in header["ripple_sources"]]
+    for name in RECORDED_SETTINGS:
+        if name in header and name != "threaded_render":
+            getattr(sim, name).set(header[name])
+    sim.add_waves(header["waves"])
+    sim.apply_backend()
+    sim.running = header.get("running", False)
+
+    frame_times = []
+    clock = 0.0
+    next_frame = 0.0
+    for event in events[1:] + [{"type": "end", "t": duration}]:
+        if sim.running:
+            period = 1.0 / max(sim.target_fps.get(), 1)
+            next_frame = max(next_frame, clock)
+            while next_frame <= event["t"]:
+                sim.advance_time(period)
+                sim.draw_all_waves()
+                frame_times.append(next_frame)
+                next_frame += period
+        clock = event["t"]
+        if event["type"] != "end":
+            apply_event(sim, event)
+            # Event-driven redraws count as frames too, as they would in the app
+            while len(frame_times) < sim.stats.count:
+                frame_times.append(clock)
+    sim.frame_worker.stop()
+    return np.array(frame_times), sim.stats.rows()
+
+
+def report(frame_times, rows):
+    if len(rows) == 0:
+        return {"frames": 0}
+    frame_ms = rows[:, 3]
+    worst = np.argsort(frame_ms)[::-1][:5]
+    return {
+        "frames": int(len(rows)),
+        "total_ms": float(frame_ms.sum()),
+        "mean_ms": float(frame_ms.mean()),
+        "p50_ms": float(np.percentile(frame_ms, 50)),
+        "p99_ms": float(np.percentile(frame_ms, 99)),
+        "max_ms": float(frame_ms.max()),
+        "compute_ms": float(rows[:, 1].mean()),
+        "canvas_ms": float(rows[:, 2].mean()),
+        "points_per_frame": float(rows[:, 4].mean()),
+        "worst": [{"session_s": float(frame_times[i]), "frame_ms": float(frame_ms[i])} for i in worst],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded WaveLab session headless")
+    parser.add_argument("log")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--baseline", help="earlier report to compare p50/p99 against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed slowdown before a metric counts as a regression")
+    parser.add_argument("--repeat", type=int, default=REPEAT,
+                        help="replays; each frame keeps its fastest time")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be positive")
+
+    events = load(args.log)
+    frame_times, rows = replay(events)
+    for _ in range(args.repeat - 1):
+        # Same log, same frames, so runs line up row by row
+        again = replay(events)[1]
+        rows = np.where((again[:, 3] < rows[:, 3])[:, None], again, rows)
+    result = report(frame_times, rows)
+    if not result["frames"]:
+        print("No frames drawn in this session.")
+        return 0
+    print(f"{result['frames']} frames  mean {result['mean_ms']:.2f} ms  p50 {result['p50_ms']:.2f} ms  "
+          f"p99 {result['p99_ms']:.2f} ms  max {result['max_ms']:.2f} ms  "
+          f"({result['compute_ms']:.2f} compute + {result['canvas_ms']:.2f} canvas)")
+    for w in result["worst"]:
+        print(f"  slow frame at {w['session_s']:.2f} s: {w['frame_ms']:.2f} ms")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = [(key, result[key] / baseline[key]) for key in ("p50_ms", "p99_ms")
+                       if baseline.get(key) and result[key] / baseline[key] > 1 + args.tolerance]
+        for key, ratio in regressions:
+            print(f"REGRESSION {key}: x{ratio:.2f}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+from frame_scheduler import FrameScheduler
+import frame_worker
+from wave_sim import WaveSimulator
+from wave_store import WaveStore
+
+CACHE_LIMIT = 32  # cached frames kept between ticks
+
+
+class SimulationHub:
+    """
+    One wave store, one clock and one per-frame sample cache shared by
+    several WaveSimulator views.
+
+    Every tick advances each view's time (views keep their own speed) and
+    redraws them all. Views showing the same size at the same time reuse
+    the samples the first one computed, so an extra view mostly costs its
+    canvas update.
+    """
+
+    def __init__(self, master, target_fps=60):
+        self.master = master
+        self.store = WaveStore()
+        self.views = []
+        self.scheduler = FrameScheduler(master, self.step, self.draw, target_fps=target_fps)
+        self.computed = 0
+        self.reused = 0
+        self._frames = {}
+        self._rings = {}  # speed -> scrolling rings; they follow width changes themselves
+        self._ring_speeds = set()  # speeds drawn since the last tick
+
+    def open_view(self):
+        return WaveSimulator(self.master, hub=self)
+
+    def add_view(self, view):
+        view.running = self.scheduler.running
+        if self.views:
+            view.t = self.views[0].t
+        self.views.append(view)
+
+    def remove_view(self, view):
+        if view in self.views:
+            self.views.remove(view)
+        if not self.views:
+            self.scheduler.stop()
+
+    def step(self, elapsed):
+        for view in self.views:
+            view.advance_time(elapsed)
+
+    def draw(self):
+        self._frames.clear()
+        for view in self.views:
+            view.draw_all_waves()
+        # Rings for speeds no view drew this tick (edited speeds, closed views) go
+        for speed in self._rings.keys() - self._ring_speeds:
+            del self._rings[speed]
+        self._ring_speeds.clear()
+
+    def _cached(self, key, compute):
+        value = self._frames.get(key)
+        if value is None:
+            if len(self._frames) >= CACHE_LIMIT:
+                self._frames.clear()
+            value = self._frames[key] = compute()
+            self.computed += 1
+        else:
+            self.reused += 1
+        return value
+
+    def frame(self, width, height, t, scroll, speed):
+        """Per-wave (coords, smooth) for a traces view, computed once per tick."""
+        if scroll:
+            self._ring_speeds.add(speed)
+
+        def compute():
+            freqs, amps, codes = (a.tolist() for a in self.store.arrays())
+            rings = self._rings.setdefault(speed, []) if scroll else None
+            return frame_worker.compute_frame(width, height, t, freqs, amps, codes, rings)
+        return self._cached(("traces", width, height, t, self.store.version, scroll), compute)
+
+    def sum_line(self, width, height, t):
+        """Flat coordinates of the superposition for a sum view."""
+        return self._cached(("sum", width, height, t, self.store.version),
+                            lambda: frame_worker.compute_sum(width, height, t, *self.store.arrays()))
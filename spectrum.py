@@ -0,0 +1,119 @@
+import math
+
+import numpy as np
+
+import wave_engine
+
+MIN_RATE = 64
+MAX_RATE = 16384
+HARMONIC_SPAN = 32  # square and saw plots reach this many times their fundamental
+MAX_HARMONICS = 512
+TABLE_SIZE = 4096  # samples per period in a harmonic table
+TABLE_LIMIT = 256  # about 8 MB of tables at most
+
+_tables = {}  # (code, harmonics) -> one band-limited period, first sample repeated at the end
+
+
+def harmonic_table(code, harmonics):
+    """One period of a square or saw built from its first `harmonics` harmonics, by inverse FFT."""
+    key = (code, harmonics)
+    table = _tables.get(key)
+    if table is None:
+        n = np.arange(1, harmonics + 1)
+        if code == wave_engine.SQUARE:
+            coeffs = np.where(n % 2 == 1, 4 / (np.pi * n), 0.0)
+        else:
+            coeffs = -2 / (np.pi * n)
+        spec = np.zeros(TABLE_SIZE // 2 + 1, dtype=complex)
+        spec[1:harmonics + 1] = -0.5j * TABLE_SIZE * coeffs  # sine series
+        period = np.fft.irfft(spec, TABLE_SIZE)
+        if len(_tables) >= TABLE_LIMIT:
+            _tables.clear()
+        table = _tables[key] = np.append(period, period[0])
+    return table
+
+
+def band_limited(t, freq, amp, code, rate):
+    """
+    Displacement at x = 0 of a square or saw wave keeping only the harmonics
+    below Nyquist, so the ones above it do not fold back into the plot.
+    """
+    freq = max(freq, wave_engine.MIN_FREQ)
+    harmonics = min(max(int(math.ceil(rate / 2 / freq)) - 1, 1), MAX_HARMONICS)
+    table = harmonic_table(code, harmonics)
+    # Phase at x = 0 is -2 pi f t; look it up with linear interpolation
+    pos = np.mod(-freq * t, 1.0) * TABLE_SIZE
+    i = np.minimum(pos.astype(np.intp), TABLE_SIZE - 1)
+    frac = pos - i
+    return amp * (table[i] + (table[i + 1] - table[i]) * frac)
+
+
+class SpectrumAnalyzer:
+    """
+    Magnitude spectrum of the superposed waveform heard at x = 0.
+
+    Keeps a sliding buffer of the last `size` samples in simulation time and
+    only synthesises the samples that are new since the previous update.
+    A Hann window is applied before the FFT.
+    """
+
+    def __init__(self, size=1024):
+        self.size = size
+        self.window = np.hanning(size)
+        self.buffer = np.zeros(size)
+        self.pos = 0  # ring write position
+        self.last_index = None  # sample index of the newest buffered sample
+        self.sample_rate = MIN_RATE
+        self.key = None
+        self.computed = 0
+
+    @staticmethod
+    def rate_for(freqs, codes=()):
+        # Power of two above Nyquist for the highest fundamental, with room
+        # for the harmonics of square and saw waves
+        spans = [HARMONIC_SPAN if code != wave_engine.SINE else 4 for code in codes] or [4] * len(freqs)
+        top = max((f * span for f, span in zip(freqs, spans)), default=4.0)
+        return min(MAX_RATE, max(MIN_RATE, 2 ** math.ceil(math.log2(max(top, 1.0)))))
+
+    def update(self, t, freqs, amps, codes):
+        rate = self.rate_for(freqs, codes)
+        key = (rate, tuple(freqs), tuple(amps), tuple(codes))
+        newest = math.floor(t * rate)
+        if key != self.key or self.last_index is None or newest < self.last_index:
+            # New wave set or time went backwards: refill the whole window
+            self.key = key
+            self.sample_rate = rate
+            self.last_index = newest - self.size
+            self.pos = 0
+
+        first = max(self.last_index + 1, newest - self.size + 1)
+        count = newest - first + 1
+        self.computed = max(count, 0)
+        if count <= 0:
+            return
+        idx = np.arange(first, newest + 1)
+        t = idx / rate
+        codes = np.asarray(codes)
+        sines = codes == wave_engine.SINE
+        samples = np.zeros(count)
+        if sines.any():
+            samples += wave_engine.displacement(0.0, t, np.asarray(freqs)[sines], np.asarray(amps)[sines],
+                                                codes[sines]).sum(axis=0)
+        for f, a, c in zip(freqs, amps, codes):
+            if c != wave_engine.SINE:
+                samples += band_limited(t, f, a, c, rate)
+        end = self.pos + count
+        if end <= self.size:
+            self.buffer[self.pos:end] = samples
+        else:
+            split = self.size - self.pos
+            self.buffer[self.pos:] = samples[:split]
+            self.buffer[:count - split] = samples[split:]
+        self.pos = end % self.size
+        self.last_index = newest
+
+    def spectrum(self):
+        """Return (frequencies in Hz, single-sided amplitude) for the buffer."""
+        ordered = np.roll(self.buffer, -self.pos)
+        mags = np.abs(np.fft.rfft(ordered * self.window)) * 2 / self.window.sum()
+        return np.fft.rfftfreq(self.size, 1.0 / self.sample_rate), mags
@@ -0,0 +1,114 @@
+import sys
+import time
+import tkinter as tk
+
+COALESCE_MS = 4  # callbacks due this close together run on the same tick
+
+
+class Job:
+    """A registered periodic callback; interval_ms may be changed at any time."""
+
+    def __init__(self, widget, callback, interval_ms, due):
+        self.widget = widget
+        self.callback = callback
+        self.interval_ms = interval_ms
+        self.due = due
+        self.suspended = False
+
+
+class TickService:
+    """
+    One after() chain per Tk root, shared by every periodic callback.
+
+    Callbacks due within COALESCE_MS of each other run on the same tick.
+    A callback whose widget is not viewable (pack_forget, hidden frame,
+    minimised window) is suspended until a <Map> event brings the widget
+    back, and with nothing runnable no timer is pending at all.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.jobs = []
+        self.ticks = 0
+        self._after_id = None
+        self._wake_pending = False
+        root.bind_all("<Map>", self._on_map, add="+")
+
+    def register(self, widget, callback, interval_ms, delay_ms=None):
+        delay = interval_ms if delay_ms is None else delay_ms
+        job = Job(widget, callback, interval_ms, time.perf_counter() + delay / 1000.0)
+        self.jobs.append(job)
+        self._reschedule()
+        return job
+
+    def unregister(self, job):
+        if job in self.jobs:
+            self.jobs.remove(job)
+            self._reschedule()
+
+    def _viewable(self, job):
+        try:
+            return bool(job.widget.winfo_viewable())
+        except tk.TclError:
+            # Widget destroyed: drop the job for good
+            self.jobs.remove(job)
+            return False
+
+    def _reschedule(self):
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        due = [job.due for job in self.jobs if not job.suspended]
+        if due:
+            delay = min(due) - time.perf_counter()
+            self._after_id = self.root.after(max(1, int(delay * 1000)), self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        self.ticks += 1
+        now = time.perf_counter()
+        horizon = now + COALESCE_MS / 1000.0
+        for job in list(self.jobs):
+            if job.suspended or job.due > horizon or job not in self.jobs:
+                continue
+            if not self._viewable(job):
+                job.suspended = True
+                continue
+            try:
+                job.callback()
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+            # Keep the deadline grid, but never replay ticks we fell behind on
+            job.due = max(job.due + job.interval_ms / 1000.0, now)
+        self._reschedule()
+
+    def _on_map(self, event=None):
+        if not self._wake_pending and any(job.suspended for job in self.jobs):
+            self._wake_pending = True
+            self.root.after_idle(self._wake)
+
+    def _wake(self):
+        self._wake_pending = False
+        now = time.perf_counter()
+        for job in list(self.jobs):
+            if job.suspended and self._viewable(job):
+                job.suspended = False
+                job.due = now
+        self._reschedule()
+
+
+def get(widget):
+    """The TickService of widget's Tk root, created on first use."""
+    root = widget._root()
+    service = getattr(root, "_tick_service", None)
+    if service is None:
+        service = root._tick_service = TickService(root)
+    return service
+
+
+def register(widget, callback, interval_ms, delay_ms=None):
+    return get(widget).register(widget, callback, interval_ms, delay_ms)
+
+
+def unregister(widget, job):
+    get(widget).unregister(job)
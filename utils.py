@@ -1,4 +0,0 @@
-import time
-
-def sleep(ms):
-    time.sleep(ms / 1000.0)
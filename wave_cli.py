@@ -0,0 +1,93 @@
+"""
+Headless batch generation of wave displacement data.
+
+    python wave_cli.py --wave sine:2:60 --wave square:3:40 \\
+        --x-stop 800 --nx 801 --t-stop 2 --nt 121 -o waves.csv
+    python wave_cli.py --wave saw:5:30 --nt 10000 --format npy -o waves.npy
+
+Rows cover the time/space grid in time-major order with columns
+t, x, one displacement per wave, and their sum. Output is produced in
+chunks of --chunk-rows grid points, so the grid never has to fit in memory.
+"""
+import argparse
+import sys
+
+import numpy as np
+
+import wave_engine
+
+CHUNK_ROWS = 65536
+
+
+def grid_chunks(waves, x_start, x_stop, nx, t_start, t_stop, nt, chunk_rows=CHUNK_ROWS):
+    """Yield (rows, len(waves) + 3) float arrays covering the grid in order."""
+    freqs = [w["freq"] for w in waves]
+    amps = [w["amp"] for w in waves]
+    codes = [wave_engine.type_code(w["wave_type"]) for w in waves]
+    dx = (x_stop - x_start) / (nx - 1) if nx > 1 else 0.0
+    dt = (t_stop - t_start) / (nt - 1) if nt > 1 else 0.0
+
+    total = nx * nt
+    for start in range(0, total, chunk_rows):
+        idx = np.arange(start, min(start + chunk_rows, total))
+        t = t_start + (idx // nx) * dt
+        x = x_start + (idx % nx) * dx
+        values = wave_engine.displacement(x, t, freqs, amps, codes)
+        yield np.column_stack((t, x, values.T, values.sum(axis=0)))
+
+
+def header(waves):
+    return ["t", "x"] + [f"wave{i + 1}_{w['wave_type']}" for i, w in enumerate(waves)] + ["sum"]
+
+
+def write_csv(out, waves, chunks):
+    out.write(",".join(header(waves)) + "\n")
+    for chunk in chunks:
+        np.savetxt(out, chunk, delimiter=",", fmt="%.6g")
+
+
+def write_npy(out, waves, chunks, rows):
+    # Header first with the final shape, then raw little-endian rows
+    np.lib.format.write_array_header_1_0(
+        out, {"descr": "<f8", "fortran_order": False, "shape": (rows, len(waves) + 3)})
+    for chunk in chunks:
+        out.write(chunk.astype("<f8").tobytes())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate WaveLab displacement data without a display")
+    parser.add_argument("--wave", action="append", type=wave_engine.parse_wave_spec, required=True,
+                        help="type:freq:amp, repeat for several waves")
+    parser.add_argument("--x-start", type=float, default=0.0, help="px")
+    parser.add_argument("--x-stop", type=float, default=800.0, help="px, inclusive")
+    parser.add_argument("--nx", type=int, default=801)
+    parser.add_argument("--t-start", type=float, default=0.0, help="s")
+    parser.add_argument("--t-stop", type=float, default=1.0, help="s, inclusive")
+    parser.add_argument("--nt", type=int, default=61)
+    parser.add_argument("--format", choices=("csv", "npy"), default=None,
+                        help="default: from the output extension, else csv")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("-o", "--output", default="-", help="file, or - for stdout")
+    args = parser.parse_args(argv)
+    if args.nx < 1 or args.nt < 1 or args.chunk_rows < 1:
+        parser.error("--nx, --nt and --chunk-rows must be positive")
+
+    fmt = args.format or ("npy" if args.output.endswith(".npy") else "csv")
+    chunks = grid_chunks(args.wave, args.x_start, args.x_stop, args.nx,
+                         args.t_start, args.t_stop, args.nt, args.chunk_rows)
+    if fmt == "npy":
+        out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    else:
+        out = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        if fmt == "npy":
+            write_npy(out, args.wave, chunks, args.nx * args.nt)
+        else:
+            write_csv(out, args.wave, chunks)
+    finally:
+        if args.output != "-":
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import numpy as np
+
+# Same constants generate_wave_y always used
+BASE_SPEED = 200.0
+MAX_WAVE_SPEED = 1000.0  # px/s
+MIN_FREQ = 0.001
+
+WAVE_TYPES = ("sine", "square", "saw")
+SINE, SQUARE, SAW = range(3)
+
+
+def type_code(wave_type):
+    # Unknown types fall back to sine, like generate_wave_y did
+    try:
+        return WAVE_TYPES.index(wave_type)
+    except ValueError:
+        return SINE
+
+
+def parse_wave_spec(text):
+    """Parse "type:freq:amp[:color]" (e.g. "sine:2:60") as used by the command-line tools."""
+    parts = text.split(":")
+    if len(parts) not in (3, 4) or parts[0] not in WAVE_TYPES:
+        raise ValueError(f"expected type:freq:amp[:color] with type in {WAVE_TYPES}, got {text!r}")
+    freq, amp = float(parts[1]), float(parts[2])
+    if freq <= 0 or amp <= 0:
+        raise ValueError(f"frequency and amplitude must be positive in {text!r}")
+    return {"wave_type": parts[0], "freq": freq, "amp": amp,
+            "color": parts[3] if len(parts) == 4 else "#e81ad7"}
+
+
+def wave_kinematics(freq):
+    """Return (wave_speed, k) for one frequency or an array of them."""
+    freq = np.maximum(freq, MIN_FREQ)
+    wave_speed = np.minimum(BASE_SPEED * freq, MAX_WAVE_SPEED)
+    wavelength = wave_speed / freq
+    k = 2 * np.pi / wavelength
+    return wave_speed, k
+
+
+def waveform(phase, codes):
+    """Unit-amplitude wave values for phase array(s) and matching type codes."""
+    phase = np.asarray(phase, dtype=float)
+    codes = np.asarray(codes)
+    s = np.sin(phase)
+    if not np.any(codes):
+        return s
+    square = np.where(s >= 0, 1.0, -1.0)
+    saw = 2 * (np.mod(phase / (2 * np.pi), 1.0) - 0.5)
+    return np.where(codes == SQUARE, square, np.where(codes == SAW, saw, s))
+
+
+def displacement(x, t, freqs, amps, codes, phases=None):
+    """
+    Signed displacement (amp * wave value) of each wave at positions x (px)
+    and times t (s), broadcast together. Returns shape (len(freqs),) + shape.
+    phases are optional per-wave offsets in radians.
+    """
+    x, t = np.broadcast_arrays(np.asarray(x, dtype=float), np.asarray(t, dtype=float))
+    per_wave = (-1,) + (1,) * x.ndim
+    freqs = np.asarray(freqs, dtype=float).reshape(per_wave)
+    amps = np.asarray(amps, dtype=float).reshape(per_wave)
+    codes = np.asarray(codes, dtype=np.int8).reshape(per_wave)
+
+    wave_speed, k = wave_kinematics(freqs)
+    phase = k * (x - wave_speed * t)
+    if phases is not None:
+        phase = phase + np.asarray(phases, dtype=float).reshape(per_wave)
+    return amps * waveform(phase, codes)
+
+
+def sample_waves(width, height, t, freqs, amps, codes, xs=None):
+    """
+    Canvas y-coordinates for a batch of waves at time t.
+
+    freqs, amps and codes are equal-length sequences (one entry per wave);
+    xs defaults to every pixel column 0..width. Returns (xs, ys) with ys of
+    shape (len(freqs), len(xs)).
+    """
+    if xs is None:
+        xs = np.arange(width + 1, dtype=float)
+    else:
+        xs = np.asarray(xs, dtype=float)
+    freqs = np.asarray(freqs, dtype=float).reshape(-1, 1)
+    amps = np.asarray(amps, dtype=float).reshape(-1, 1)
+    codes = np.asarray(codes, dtype=np.int8).reshape(-1, 1)
+
+    wave_speed, k = wave_kinematics(freqs)
+    phase = k * (xs - wave_speed * t)
+    return xs, (height // 2) - amps * waveform(phase, codes)
+
+
+def interleave(xs, ys):
+    """Flatten matching x/y arrays into the x0, y0, x1, y1, ... list Tk wants."""
+    flat = np.empty(2 * len(xs))
+    flat[0::2] = xs
+    flat[1::2] = ys
+    return flat.tolist()
@@ -1,44 +1,196 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import math
+from tkinter import ttk, messagebox, filedialog
+import multiprocessing
+import os
 import random
+import threading
 import time
 
-from quiz_frame import QuizFrame
-from utils import sleep
+from frame_scheduler import FrameScheduler
+import frame_worker
+from perf_stats import FrameStats, TclCallCounter
+import raster
+from ripple_tank import RippleTank
+import scenario
+import scrolling
+import session_log
+import tick_service
+import wave_engine
+from wave_store import WaveStore
+
+RESIZE_DEBOUNCE_MS = 80
+SPECTRUM_INTERVAL_MS = 100
+LEGEND_MAX = 12  # legend lines; the rest are summarised
+VIEW_MODES = ("traces", "sum", "ripple tank")
+SUM_COLOR = "#ffffff"
+RIPPLE_BUDGET = 0.6  # share of the frame budget the ripple field may use
+SESSION_LOG_ENV = "WAVELAB_SESSION_LOG"  # record the first view's session to this file
 
 class WaveSimulator(tk.Frame):
-    def __init__(self, master):
+    def __init__(self, master, hub=None):
         super().__init__(master)
         self.master = master
-        self.pack(fill="both", expand=True)
-        self.running = False
-        self.t = 0.0
-
-        self.waves = []
-        self.add_wave(freq=2.0, amp=60.0, wave_type="sine", color="#e81ad7")
-
-        self.speed = tk.DoubleVar(value=1.0)
-        self.show_grid = tk.BooleanVar(value=True)
+        # With a SimulationHub, views share its waves and clock and sit side by side
+        self.hub = hub
+        self.pack(fill="both", expand=True, side="left" if hub is not None else "top")
+        self.init_state()
 
         self.create_widgets()
+        self.sync_wave_items()
         self.draw_static_elements()
+        self.session_path = os.environ.get(SESSION_LOG_ENV)
+        if self.session_path and self.views()[0] is self:
+            self.start_recording()
+
+    def destroy(self):
+        self.frame_worker.stop()
+        if self.recorder is not None and self.session_path:
+            self.stop_recording(self.session_path)
+        if self.hub is not None:
+            self.hub.remove_view(self)
+        super().destroy()
+
+    def init_state(self):
+        # Everything except widgets, so the render path can also run headless
+        # Widgets and variables created from this view inherit the counting interpreter
+        self.tk = TclCallCounter(self.tk)
+        self.running = False
+        self.t = 0.0
+        self.canvas = None
+        self.recorder = None
+        # Canvas item per wave; lines are moved with coords() rather than recreated
+        self.reuse_wave_items = True
+        self.wave_items = []
+        self.wave_smooth = []
+        self.wave_rings = []
+        self.sum_item = None
+
+        # Plain arrays for the render path; Tk variables only where a widget edits a wave
+        self.store = self.hub.store if self.hub is not None else WaveStore()
+        self._store_generation = self.store.generation
+        self.bound_vars = {}
+        self.wave_editors = {}
+        if not len(self.store):
+            self.add_wave(freq=2.0, amp=60.0, wave_type="sine", color="#e81ad7")
+
+        self.speed = tk.DoubleVar(self, value=1.0)
+        self.show_grid = tk.BooleanVar(self, value=True)
+        self.target_fps = tk.IntVar(self, value=60)
+        self.show_hud = tk.BooleanVar(self, value=False)
+        self.scroll_render = tk.BooleanVar(self, value=True)
+        self.threaded_render = tk.BooleanVar(self, value=False)
+        self.render_backend = tk.StringVar(self, value="vector")
+        self.raster = None
+        self.photo_factory = tk.PhotoImage
+        self.view_mode = tk.StringVar(self, value=VIEW_MODES[0])
+        self.ripple = None
+        self.adapt_ripple = True  # off in replays, which take cell sizes from the log
+        self.frame_worker = frame_worker.FrameWorker()
+        self.show_spectrum = tk.BooleanVar(self, value=False)
+        self.analyzer = None
+        self._spectrum_job = None
+        self._spectrum_axis_key = None
+        self.stats = FrameStats()
+        self.static_items = 0
+        self._static_key = None
+        self._static_after = None
+        self._hud_updated = 0.0
+        for name in session_log.RECORDED_SETTINGS:
+            getattr(self, name).trace_add("write", lambda *_, n=name: self.record_setting(n))
+        if self.hub is not None:
+            self.scheduler = self.hub.scheduler
+            self.hub.add_view(self)
+        else:
+            self.scheduler = FrameScheduler(self, self.advance_time, self.draw_all_waves,
+                                            target_fps=self.target_fps.get())
 
     def add_wave(self, freq=2.0, amp=60.0, wave_type="sine", color="#e81ad7"):
-        wave = {
-            "freq": tk.DoubleVar(value=freq),
-            "amp": tk.DoubleVar(value=amp),
-            "wave_type": tk.StringVar(value=wave_type),
-            "color": color
-        }
-        self.waves.append(wave)
+        self.store.add(freq, amp, wave_type, color)
+        self.sync_wave_items()
+        for view in self.views():
+            view.record("add_waves", waves=[{"freq": freq, "amp": amp, "wave_type": wave_type, "color": color}])
+
+    def add_waves(self, specs, replace=False):
+        # One batch: canvas items created together, a single static and wave redraw
+        if replace:
+            self.remove_all_waves()
+        specs = list(specs)
+        self.store.extend(specs)
+        for view in self.views():
+            view.record("add_waves", waves=specs, replace=replace)
+        self.waves_changed()
+
+    def views(self):
+        return self.hub.views if self.hub is not None else [self]
+
+    def waves_changed(self):
+        # Every view on the shared store picks up the new list with one redraw
+        for view in self.views():
+            view.sync_wave_items()
+            if view.canvas is not None:
+                view.draw_static_elements()
+                view.draw_all_waves()
+
+    def remove_all_waves(self):
+        self.store.clear()
+        self.release_wave_vars()
+        self.sync_wave_items()
+
+    def wave_vars(self, idx):
+        # Tk variables for a widget that edits wave idx; writes go through to the store
+        bound = self.bound_vars.get(idx)
+        if bound is None:
+            bound = {"freq": tk.DoubleVar(self, value=float(self.store.freq[idx])),
+                     "amp": tk.DoubleVar(self, value=float(self.store.amp[idx])),
+                     "wave_type": tk.StringVar(self, value=self.store.wave_type(idx))}
+            for name, var in bound.items():
+                var.trace_add("write", lambda *_, n=name, v=var: self.write_through(idx, n, v))
+            self.bound_vars[idx] = bound
+        return bound
+
+    def release_wave_vars(self):
+        # Orphaned variables must not write to whichever wave later takes their index
+        for bound in self.bound_vars.values():
+            for var in bound.values():
+                for mode, callback in var.trace_info():
+                    var.trace_remove(mode, callback)
+        self.bound_vars.clear()
+        for win in self.wave_editors.values():
+            if win.winfo_exists():
+                win.destroy()
+        self.wave_editors.clear()
+
+    def write_through(self, idx, name, var):
+        try:
+            value = var.get()
+        except tk.TclError:
+            return  # half-typed entry
+        if name != "wave_type" and value <= 0:
+            return
+        self.store.update(idx, **{name: value})
+        for view in self.views():
+            view.record("update_wave", idx=idx, name=name, value=value)
+            view.schedule_static_redraw()
+
+    def current_scenario(self):
+        return scenario.make_scenario(self.store.specs(), self.speed.get(), self.show_grid.get())
+
+    def apply_scenario(self, data):
+        self.speed.set(data["speed"])
+        self.show_grid.set(data["show_grid"])
+        # Views on a hub share one clock
+        for view in self.views():
+            view.t = 0.0
+            view.record("set_time", value=0.0)
+        self.add_waves(data["waves"], replace=True)
 
     def clear_waves(self):
         if messagebox.askyesno("Clear Waves", "Are you sure you want to remove all waves?"):
-            self.waves.clear()
-            self.t = 0.0
-            self.draw_static_elements()
-            self.canvas.delete("wave")
+            self.remove_all_waves()
+            for view in self.views():
+                view.t = 0.0
+                view.record("clear")
+            self.waves_changed()
             self.info_var.set("All waves cleared.")
 
     def create_widgets(self):
@@ -48,33 +200,72 @@ class WaveSimulator(tk.Frame):
         ttk.Button(control_frame, text="Add Wave", command=self.add_wave_ui).grid(row=0, column=0, padx=4, pady=4)
         ttk.Checkbutton(control_frame, text="Show grid/axes",
                         variable=self.show_grid, command=self.draw_static_elements).grid(row=0, column=1, padx=4)
+        ttk.Checkbutton(control_frame, text="Performance HUD",
+                        variable=self.show_hud, command=self.toggle_hud).grid(row=0, column=2, padx=4)
+        ttk.Checkbutton(control_frame, text="Scrolling render",
+                        variable=self.scroll_render).grid(row=0, column=3, padx=4, sticky="w")
+        ttk.Checkbutton(control_frame, text="Background compute",
+                        variable=self.threaded_render).grid(row=0, column=4, padx=4, sticky="w")
+        ttk.Checkbutton(control_frame, text="Spectrum",
+                        variable=self.show_spectrum, command=self.toggle_spectrum).grid(row=0, column=5, padx=4, sticky="w")
+
+        ttk.Label(control_frame, text="Target FPS:").grid(row=1, column=0, sticky="e")
+        self.fps_spin = ttk.Spinbox(control_frame, from_=10, to=240, increment=10, width=6,
+                                    textvariable=self.target_fps, command=self.validate_fps)
+        self.fps_spin.grid(row=1, column=1, sticky="w", padx=4)
+        self.fps_spin.bind("<Return>", lambda e: self.validate_fps())
 
         ttk.Label(control_frame, text="Speed (type any positive value):").grid(row=1, column=2)
         self.speed_entry = ttk.Entry(control_frame, textvariable=self.speed)
         self.speed_entry.grid(row=1, column=3, sticky="ew", padx=(4, 10))
         self.speed_entry.bind("<Return>", lambda e: self.validate_speed())
 
+        ttk.Label(control_frame, text="Renderer:").grid(row=1, column=4, sticky="e")
+        ttk.OptionMenu(control_frame, self.render_backend, self.render_backend.get(),
+                       *raster.BACKENDS, command=self.apply_backend).grid(row=1, column=5, sticky="w", padx=4)
+        ttk.Label(control_frame, text="View:").grid(row=1, column=6, sticky="e")
+        ttk.OptionMenu(control_frame, self.view_mode, self.view_mode.get(),
+                       *VIEW_MODES, command=self.apply_backend).grid(row=1, column=7, sticky="w", padx=4)
+
         control_frame.columnconfigure(3, weight=1)
 
         btn_frame = ttk.Frame(self)
         btn_frame.pack(side="top", fill="x", padx=8, pady=(0, 8))
-        self.start_btn = ttk.Button(btn_frame, text="Start", command=self.toggle_run)
+        self.start_btn = ttk.Button(btn_frame, text="Stop" if self.running else "Start", command=self.toggle_run)
         self.start_btn.pack(side="left")
         ttk.Button(btn_frame, text="Clear Waves", command=self.clear_waves).pack(side="left", padx=6)
         ttk.Button(btn_frame, text="Reset Time", command=self.reset_time).pack(side="left", padx=6)
+        ttk.Button(btn_frame, text="Load Scenario", command=self.load_scenario_ui).pack(side="left", padx=6)
+        ttk.Button(btn_frame, text="Save Scenario", command=self.save_scenario_ui).pack(side="left", padx=6)
+        ttk.Button(btn_frame, text="Export Stats", command=self.export_stats).pack(side="left", padx=6)
+        ttk.Button(btn_frame, text="Export WAV", command=self.export_wav_ui).pack(side="left", padx=6)
+        ttk.Button(btn_frame, text="Render Frames", command=self.render_frames_ui).pack(side="left", padx=6)
         ttk.Button(btn_frame, text="Start/End Quiz", command=self.toggle_quiz).pack(side="right")
+        if self.hub is not None:
+            ttk.Button(btn_frame, text="Close View", command=self.close_view).pack(side="right", padx=6)
+            ttk.Button(btn_frame, text="New View", command=self.hub.open_view).pack(side="right", padx=6)
 
         self.canvas = tk.Canvas(self, bg="black", height=280)
         self.canvas.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        self.canvas.bind("<Configure>", self.schedule_static_redraw)
+        self.canvas.bind("<Button-1>", self.on_canvas_click)
+        self.canvas.tag_bind("legend", "<Double-Button-1>", self.on_legend_click)
+
+        # Optional frequency-domain view, packed under the wave canvas on demand
+        self.spectrum_canvas = tk.Canvas(self, bg="black", height=120)
+        self.spectrum_line = self.spectrum_canvas.create_line(0, 0, 0, 0, fill="#00e5ff", width=1)
+        self.spectrum_label = self.spectrum_canvas.create_text(8, 6, anchor="nw", fill="#ffffff",
+                                                               font=("Segoe UI", 9))
 
         info_frame = ttk.Frame(self)
         info_frame.pack(side="top", fill="x", padx=8, pady=(0, 8))
         self.info_var = tk.StringVar(value="Press Start to animate waves.")
         ttk.Label(info_frame, textvariable=self.info_var).pack(side="left")
+        self.hud_var = tk.StringVar(value="")
+        self.hud_label = ttk.Label(info_frame, textvariable=self.hud_var, foreground="#3CCA45")
 
-        self.quiz_frame = QuizFrame(self)
-        self.quiz_frame.pack(fill="x", padx=8, pady=8)
-        self.quiz_frame.pack_forget()
+        # Built on first use; the question bank is not needed for the simulation
+        self.quiz_frame = None
 
     def validate_speed(self):
         try:
@@ -89,6 +280,16 @@ class WaveSimulator(tk.Frame):
             messagebox.showwarning("Invalid Input", "Speed must be a positive number. Resetting to 1.0.")
             self.speed.set(1.0)
 
+    def validate_fps(self):
+        try:
+            val = int(self.target_fps.get())
+            val = min(max(val, 10), 240)
+        except (ValueError, tk.TclError):
+            messagebox.showwarning("Invalid Input", "Target FPS must be a whole number. Resetting to 60.")
+            val = 60
+        self.target_fps.set(val)
+        self.scheduler.target_fps = val
+
     def add_wave_ui(self):
         win = tk.Toplevel(self)
         win.title("Add Wave")
@@ -117,12 +318,143 @@ class WaveSimulator(tk.Frame):
             self.validate_freq(freq_var)
             self.validate_amp(amp_var)
             self.add_wave(freq_var.get(), amp_var.get(), wave_var.get(), color_var.get())
-            self.draw_static_elements()
-            self.draw_all_waves()
+            self.waves_changed()
             win.destroy()
 
         ttk.Button(win, text="Add Wave", command=add_and_close).grid(row=4, column=0, columnspan=2, pady=8)
 
+    def on_legend_click(self, event):
+        # Double-clicking a legend line edits that wave
+        for tag in self.canvas.gettags("current"):
+            if tag.startswith("legend") and tag[6:].isdigit():
+                self.edit_wave_ui(int(tag[6:]))
+                return
+
+    def edit_wave_ui(self, idx):
+        win = self.wave_editors.get(idx)
+        if win is not None and win.winfo_exists():
+            win.lift()
+            return
+        win = self.wave_editors[idx] = tk.Toplevel(self)
+        win.title(f"Edit Wave {idx + 1}")
+        # Edits go straight to the store through the variables' traces
+        bound = self.wave_vars(idx)
+
+        ttk.Label(win, text="Frequency (Hz):").grid(row=0, column=0)
+        ttk.Entry(win, textvariable=bound["freq"]).grid(row=0, column=1)
+        ttk.Label(win, text="Amplitude (px):").grid(row=1, column=0)
+        ttk.Entry(win, textvariable=bound["amp"]).grid(row=1, column=1)
+        ttk.Label(win, text="Wave type:").grid(row=2, column=0)
+        ttk.OptionMenu(win, bound["wave_type"], bound["wave_type"].get(),
+                       *wave_engine.WAVE_TYPES).grid(row=2, column=1)
+        ttk.Button(win, text="Close", command=win.destroy).grid(row=3, column=0, columnspan=2, pady=8)
+
+    def export_wav_ui(self):
+        import audio_export
+        if not len(self.store):
+            messagebox.showinfo("Export WAV", "Add at least one wave first.")
+            return
+        win = tk.Toplevel(self)
+        win.title("Export WAV")
+
+        ttk.Label(win, text="Sample rate (Hz):").grid(row=0, column=0)
+        rate_var = tk.IntVar(value=44100)
+        ttk.OptionMenu(win, rate_var, 44100, *audio_export.SAMPLE_RATES).grid(row=0, column=1)
+
+        ttk.Label(win, text="Duration (seconds):").grid(row=1, column=0)
+        duration_var = tk.DoubleVar(value=5.0)
+        ttk.Entry(win, textvariable=duration_var).grid(row=1, column=1)
+
+        def export_and_close():
+            try:
+                duration = float(duration_var.get())
+                if duration <= 0:
+                    raise ValueError
+            except (ValueError, tk.TclError):
+                messagebox.showwarning("Invalid Input", "Duration must be a positive number.", parent=win)
+                return
+            path = filedialog.asksaveasfilename(parent=win, title="Export WAV",
+                                                defaultextension=".wav", filetypes=[("WAV audio", "*.wav")])
+            if not path:
+                return
+            win.destroy()
+            job = (path, *self.wave_arrays())
+            rate = rate_var.get()
+            self.info_var.set(f"Exporting audio to {path}...")
+
+            def finished(frames):
+                if frames is None:
+                    self.info_var.set("Audio export failed.")
+                else:
+                    self.info_var.set(f"Exported {frames} samples to {path}")
+            self.run_in_background(lambda: audio_export.export_wav(*job, sample_rate=rate, duration=duration),
+                                   finished)
+
+        ttk.Button(win, text="Export", command=export_and_close).grid(row=2, column=0, columnspan=2, pady=8)
+
+    def render_frames_ui(self):
+        import offline_render
+        if not len(self.store):
+            messagebox.showinfo("Render Frames", "Add at least one wave first.")
+            return
+        win = tk.Toplevel(self)
+        win.title("Render Frames")
+
+        fields = {}
+        for row, (label, default) in enumerate((("Start time (s):", 0.0), ("End time (s):", 5.0),
+                                                ("Frames per second:", 30.0))):
+            ttk.Label(win, text=label).grid(row=row, column=0)
+            fields[label] = tk.DoubleVar(value=default)
+            ttk.Entry(win, textvariable=fields[label]).grid(row=row, column=1)
+
+        ttk.Label(win, text="Format:").grid(row=3, column=0)
+        fmt_var = tk.StringVar(value="png")
+        ttk.OptionMenu(win, fmt_var, "png", *offline_render.FORMATS).grid(row=3, column=1)
+
+        def render_and_close():
+            try:
+                start, end, fps = (float(var.get()) for var in fields.values())
+                if end <= start or fps <= 0:
+                    raise ValueError
+            except (ValueError, tk.TclError):
+                messagebox.showwarning("Invalid Input", "End must be after start and fps positive.", parent=win)
+                return
+            out_dir = filedialog.askdirectory(parent=win, title="Output Folder")
+            if not out_dir:
+                return
+            win.destroy()
+
+            w = self.canvas.winfo_width() or self.canvas.winfo_reqwidth()
+            h = self.canvas.winfo_height() or 280
+            job = (out_dir, *self.wave_arrays(), self.store.colors(),
+                   start, end, fps, w, h, fmt_var.get(), None, self.show_grid.get())
+            self.info_var.set(f"Rendering frames to {out_dir}...")
+
+            def finished(paths):
+                if paths is None:
+                    self.info_var.set("Frame rendering failed.")
+                else:
+                    self.info_var.set(f"Rendered {len(paths)} frames to {out_dir}")
+            # Forking a process with Tk's threads and X connection open can deadlock
+            spawn = multiprocessing.get_context("spawn")
+            self.run_in_background(lambda: offline_render.render_sequence(*job, mp_context=spawn), finished)
+
+        ttk.Button(win, text="Render", command=render_and_close).grid(row=4, column=0, columnspan=2, pady=8)
+
+    def run_in_background(self, work, done):
+        # Long exports run off the UI thread; a tick polls for the result
+        # and calls done with it, or with None if work raised
+        result = []
+        worker = threading.Thread(target=lambda: result.append(work()), daemon=True)
+        worker.start()
+
+        def poll():
+            if worker.is_alive():
+                return
+            tick_service.unregister(self, poll_job)
+            done(result[0] if result else None)
+        poll_job = tick_service.register(self, poll, 200)
+
     def validate_freq(self, var):
         try:
             val = float(var.get())
@@ -143,97 +475,384 @@ class WaveSimulator(tk.Frame):
             messagebox.showwarning("Invalid Input", "Amplitude must be a positive number. Resetting to 60.0.")
             var.set(60.0)
 
+    def toggle_hud(self):
+        if self.show_hud.get():
+            self.stats.clear()
+            self.hud_label.pack(side="right")
+        else:
+            self.hud_label.pack_forget()
+
+    def save_scenario_ui(self):
+        path = filedialog.asksaveasfilename(
+            parent=self, title="Save Scenario", defaultextension=".json",
+            initialdir=scenario.PRESETS_DIR, filetypes=[("Scenario", "*.json")])
+        if not path:
+            return
+        scenario.save(path, self.current_scenario())
+        self.info_var.set(f"Scenario saved to {path}")
+
+    def load_scenario_ui(self):
+        path = filedialog.askopenfilename(
+            parent=self, title="Load Scenario", initialdir=scenario.PRESETS_DIR,
+            filetypes=[("Scenario", "*.json")])
+        if not path:
+            return
+        try:
+            data = scenario.load(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Load Scenario", f"Could not load {path}:\n{e}")
+            return
+        self.apply_scenario(data)
+        self.info_var.set(f"Loaded {len(data['waves'])} waves from {path}")
+
+    def export_stats(self):
+        path = filedialog.asksaveasfilename(
+            parent=self, title="Export Frame Stats", defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON", "*.json")])
+        if not path:
+            return
+        self.stats.export(path)
+        self.info_var.set(f"Frame stats exported to {path}")
+
+    def toggle_spectrum(self):
+        if self.show_spectrum.get():
+            if self.analyzer is None:
+                from spectrum import SpectrumAnalyzer
+                self.analyzer = SpectrumAnalyzer()
+            self.spectrum_canvas.pack(after=self.canvas, fill="x", padx=8, pady=(0, 8))
+            if self._spectrum_job is None:
+                self._spectrum_job = tick_service.register(self.spectrum_canvas, self.update_spectrum,
+                                                           SPECTRUM_INTERVAL_MS, delay_ms=0)
+        else:
+            self.spectrum_canvas.pack_forget()
+            if self._spectrum_job is not None:
+                tick_service.unregister(self, self._spectrum_job)
+                self._spectrum_job = None
+
+    def update_spectrum(self):
+        # Own throttled rate, independent of the animation frame rate
+        freqs, amps, codes = self.wave_arrays()
+        self.analyzer.update(self.t, freqs, amps, codes)
+        self.draw_spectrum(sum(amps))
+
+    def draw_spectrum(self, full_scale):
+        c = self.spectrum_canvas
+        w = c.winfo_width() or c.winfo_reqwidth()
+        h = c.winfo_height() or 120
+        nyquist = self.analyzer.sample_rate / 2
+        bins, mags = self.analyzer.spectrum()
+
+        if self._spectrum_axis_key != (w, h, nyquist):
+            self._spectrum_axis_key = (w, h, nyquist)
+            c.delete("axis")
+            c.create_line(0, h - 16, w, h - 16, fill="#434040", tags="axis")
+            for i in range(1, 5):
+                x = w * i / 5
+                c.create_text(x, h - 2, anchor="s", text=f"{nyquist * i / 5:g} Hz",
+                              fill="#888888", font=("Segoe UI", 8), tags="axis")
+
+        ys = (h - 16) - mags / max(full_scale, 1e-9) * (h - 32)
+        c.coords(self.spectrum_line, wave_engine.interleave(bins / nyquist * w, ys))
+        peak = int(mags[1:].argmax()) + 1 if len(mags) > 1 else 0
+        c.itemconfig(self.spectrum_label,
+                     text=f"Peak {bins[peak]:.2f} Hz  |  window {self.analyzer.size / self.analyzer.sample_rate:.1f} s")
+
     def toggle_quiz(self):
+        if self.quiz_frame is None:
+            from quiz_frame import QuizFrame
+            self.quiz_frame = QuizFrame(self)
         if self.quiz_frame.winfo_ismapped():
             self.quiz_frame.pack_forget()
         else:
             self.quiz_frame.pack(fill="x", padx=8, pady=8)
 
-    def draw_static_elements(self):
-        self.canvas.delete("all")
+    def sync_wave_items(self):
+        # Create/destroy line items only when the wave list changes size
+        if self._store_generation != self.store.generation:
+            # The list was replaced, possibly from another view on the same store
+            self._store_generation = self.store.generation
+            self.release_wave_vars()
+            while self.wave_items:
+                self.canvas.delete(self.wave_items.pop())
+                self.wave_smooth.pop()
+                self.wave_rings.pop()
+        if self.canvas is None:
+            return
+        while len(self.wave_items) > len(self.store):
+            self.canvas.delete(self.wave_items.pop())
+            self.wave_smooth.pop()
+            self.wave_rings.pop()
+        state = "normal" if self.traces_visible() else "hidden"
+        for idx in range(len(self.wave_items), len(self.store)):
+            self.wave_items.append(self.canvas.create_line(0, 0, 0, 0, fill=self.store.color_of(idx), width=2,
+                                                           tags="wave", smooth=True, state=state))
+            self.wave_smooth.append(True)
+            self.wave_rings.append(scrolling.ColumnRing())
+
+    def legend_lines(self):
+        store = self.store
+        shown = min(len(store), LEGEND_MAX)
+        lines = [f"Wave {idx+1}: {store.wave_type(idx).capitalize()}  |  Freq: {store.freq[idx]:.2f} Hz  |  Amp: {store.amp[idx]:.0f}px"
+                 for idx in range(shown)]
+        if len(store) > shown:
+            lines.append(f"... and {len(store) - shown} more waves")
+        return lines
+
+    def draw_static_elements(self, force=False):
         w = self.canvas.winfo_width() or self.canvas.winfo_reqwidth()
         h = self.canvas.winfo_height() or 280
+        # Grid, axes and legend only change with the canvas size or the wave list
+        key = (w, h, self.show_grid.get(), self.store.version)
+        if key == self._static_key and not force:
+            return
+        self._static_key = key
+        legend = self.legend_lines()
+
+        self.canvas.delete("static")
         mid_y = h // 2
 
         if self.show_grid.get():
-            self.canvas.create_line(0, mid_y, w, mid_y, fill="#3CCA45", width=1)
+            self.canvas.create_line(0, mid_y, w, mid_y, fill="#3CCA45", width=1, tags="static")
             for x in range(0, w, 50):
-                self.canvas.create_line(x, mid_y - 6, x, mid_y + 6, fill="#434040")
-                self.canvas.create_line(x, 0, x, h, fill="#434040")
+                self.canvas.create_line(x, mid_y - 6, x, mid_y + 6, fill="#434040", tags="static")
+                self.canvas.create_line(x, 0, x, h, fill="#434040", tags="static")
             for y in range(0, h, 50):
-                self.canvas.create_line(0, y, w, y, fill="#434040")
+                self.canvas.create_line(0, y, w, y, fill="#434040", tags="static")
         else:
-            self.canvas.create_line(0, mid_y, w, mid_y, fill="#3CCA45", width=1)
+            self.canvas.create_line(0, mid_y, w, mid_y, fill="#3CCA45", width=1, tags="static")
 
-        for idx, wave in enumerate(self.waves):
+        for idx, text in enumerate(legend):
+            is_wave = idx < len(self.store)
             self.canvas.create_text(
-                60, 12 + idx*14, anchor="nw",
-                text=f"Wave {idx+1}: {wave['wave_type'].get().capitalize()}  |  Freq: {wave['freq'].get():.2f} Hz  |  Amp: {wave['amp'].get():.0f}px",
-                fill=wave['color'], font=("Segoe UI", 9, "bold")
+                60, 12 + idx*14, anchor="nw", text=text,
+                fill=self.store.color_of(idx) if is_wave else "#ffffff", font=("Segoe UI", 9, "bold"),
+                tags=("static", "legend", f"legend{idx}") if is_wave else ("static", "legend")
             )
-
-    def generate_wave_y(self, x, t, wave):
-        w = self.canvas.winfo_width() or self.canvas.winfo_reqwidth()
-        freq = max(wave["freq"].get(), 0.001)
-        amp = wave["amp"].get()
-        
-        base_speed = 200
-        # Higher cap for better movement visibility
-        wave_speed = min(base_speed * (freq / 1.0), 1000)  # Max 1000 px/s
-        
-        wavelength = wave_speed / freq
-        k = 2 * math.pi / wavelength if wavelength > 0 else 0
-        
-        phase = k * (x - wave_speed * t)
-        
-        wt = wave["wave_type"].get()
-        if wt == "sine":
-            val = math.sin(phase)
-        elif wt == "square":
-            val = 1.0 if math.sin(phase) >= 0 else -1.0
-        elif wt == "saw":
-            p = (phase / (2 * math.pi)) % 1.0
-            val = 2 * (p - 0.5)
-        else:
-            val = math.sin(phase)
-        
-        return (self.canvas.winfo_height() // 2) - amp * val
-
-    def animate(self):
+        self.canvas.tag_lower("static")
+        if self.uses_image():
+            # The raster image covers the vector grid, but not the legend
+            self.canvas.tag_raise("legend")
+        self.static_items = len(self.canvas.find_withtag("static"))
+
+    def schedule_static_redraw(self, event=None):
+        # Coalesce a burst of <Configure> events into one rebuild
+        if self._static_after is not None:
+            self.after_cancel(self._static_after)
+        self._static_after = self.after(RESIZE_DEBOUNCE_MS, self._flush_static_redraw)
+
+    def _flush_static_redraw(self):
+        self._static_after = None
+        if self.recorder is not None:
+            size = (self.canvas.winfo_width(), self.canvas.winfo_height())
+            if size != self.recorder.size:
+                self.recorder.size = size
+                self.record("resize", width=size[0], height=size[1])
+        self.draw_static_elements()
         if not self.running:
-            return
+            self.draw_all_waves()
 
-        # Consistent dt without freq scaling for smooth movement
-        dt = 0.016 * self.speed.get()
-        self.t += dt
+    def generate_wave_y(self, x, t, idx):
+        # Single-point adapter over the engine; the render path batches instead
+        h = self.canvas.winfo_height()
+        _, ys = wave_engine.sample_waves(0, h, t, [self.store.freq[idx]], [self.store.amp[idx]],
+                                         [self.store.code[idx]], xs=[x])
+        return float(ys[0, 0])
 
-        self.draw_all_waves()
-        self.after(16, self.animate)
+    def wave_arrays(self):
+        # Plain Python numbers from the store; no Tcl round trips
+        freqs, amps, codes = self.store.arrays()
+        return freqs.tolist(), amps.tolist(), codes.tolist()
+
+    def advance_time(self, elapsed):
+        # Simulation time follows the wall clock, scaled by the speed setting
+        self.t += elapsed * self.speed.get()
 
     def toggle_run(self):
-        if not self.running:
-            self.running = True
-            self.start_btn.config(text="Stop")
-            self.animate()
+        # Views on a hub share one clock, so they start and stop together
+        running = not self.running
+        for view in self.views():
+            view.running = running
+            view.record("start" if running else "stop")
+            view.start_btn.config(text="Stop" if running else "Start")
+        if running:
+            self.scheduler.start()
         else:
-            self.running = False
-            self.start_btn.config(text="Start")
+            self.scheduler.stop()
 
     def reset_time(self):
-        self.t = 0.0
-        self.info_var.set("Time reset to zero.")
-        self.draw_static_elements()
+        for view in self.views():
+            view.t = 0.0
+            view.record("reset_time")
+            view.info_var.set("Time reset to zero.")
+            view.draw_static_elements()
+            view.draw_all_waves()
+
+    def close_view(self):
+        if len(self.hub.views) > 1:
+            self.destroy()
+
+    def start_recording(self):
+        self.recorder = session_log.SessionRecorder()
+        state = {name: getattr(self, name).get() for name in session_log.RECORDED_SETTINGS}
+        state.update(width=self.canvas.winfo_width(), height=self.canvas.winfo_height(),
+                     sim_t=self.t, running=self.running, waves=self.store.specs())
+        if self.ripple is not None:
+            state.update(ripple_cell=self.ripple.cell, ripple_sources=self.ripple.sources)
+        self.recorder.size = (state["width"], state["height"])
+        self.recorder.start(state)
+
+    def stop_recording(self, path):
+        recorder, self.recorder = self.recorder, None
+        recorder.save(path)
+
+    def record(self, kind, **data):
+        # Session events for a headless replay; a no-op unless recording
+        if self.recorder is not None:
+            self.recorder.log(kind, **data)
+
+    def record_setting(self, name):
+        if self.recorder is None:
+            return
+        try:
+            value = getattr(self, name).get()
+        except tk.TclError:
+            return  # half-typed entry
+        self.recorder.log("setting", name=name, value=value)
+
+    def uses_image(self):
+        mode = self.view_mode.get()
+        return mode == "ripple tank" or (mode == "traces" and self.render_backend.get() == "raster")
+
+    def traces_visible(self):
+        return self.view_mode.get() == "traces" and not self.uses_image()
+
+    def apply_backend(self, *_):
+        use_image = self.uses_image()
+        self.canvas.itemconfig("wave", state="normal" if self.traces_visible() else "hidden")
+        self.canvas.itemconfig("sum", state="normal" if self.view_mode.get() == "sum" else "hidden")
+        self.canvas.itemconfig("raster", state="normal" if use_image else "hidden")
+        self.canvas.tag_lower("static")
+        if use_image:
+            self.canvas.tag_raise("legend")
         self.draw_all_waves()
 
+    def on_canvas_click(self, event):
+        # In the ripple tank a click drags the nearest source to the pointer
+        if self.view_mode.get() != "ripple tank" or self.ripple is None:
+            return
+        w = self.canvas.winfo_width() or self.canvas.winfo_reqwidth()
+        h = self.canvas.winfo_height() or 280
+        idx = self.ripple.nearest(event.x, event.y, w, h)
+        self.ripple.move_source(idx, event.x, event.y, w, h)
+        self.record("move_source", idx=idx, x=event.x, y=event.y)
+        if not self.running:
+            self.draw_all_waves()
+
+    def draw_raster(self):
+        start = time.perf_counter()
+        calls = self.tk.calls
+        w = self.canvas.winfo_width() or self.canvas.winfo_reqwidth()
+        h = self.canvas.winfo_height() or 280
+        if self.raster is None:
+            self.raster = raster.RasterLayer(self.canvas, self.photo_factory)
+        freqs, amps, codes = self.wave_arrays()
+        ripple = self.view_mode.get() == "ripple tank"
+        if ripple:
+            if self.ripple is None:
+                self.ripple = RippleTank()
+            img = self.ripple.render(w, h, self.t, freqs, amps, codes)
+        else:
+            img = self.raster.render(w, h, self.t, freqs, amps, codes,
+                                     self.store.colors(), self.show_grid.get())
+        computed = time.perf_counter()
+        created = self.raster.item is None
+        self.raster.show(img)
+        if created:
+            self.canvas.tag_raise("legend")
+        done = time.perf_counter()
+        if ripple and self.running and self.adapt_ripple:
+            # Grid resolution follows the frame budget
+            cell = self.ripple.cell
+            self.ripple.adapt((done - start) * 1000, self.scheduler.budget * 1000 * RIPPLE_BUDGET)
+            if self.ripple.cell != cell:
+                self.record("ripple_cell", cell=self.ripple.cell)
+
+        cells = self.ripple.grid_shape(w, h) if ripple else (0, 0)
+        self.record_frame(start, computed, done, cells[0] * cells[1], self.tk.calls - calls, self.static_items + 1)
+
+    def draw_sum(self):
+        start = time.perf_counter()
+        calls = self.tk.calls
+        w = self.canvas.winfo_width() or self.canvas.winfo_reqwidth()
+        h = self.canvas.winfo_height() or 280
+        if self.hub is not None:
+            coords = self.hub.sum_line(w, h, self.t)
+        else:
+            coords = frame_worker.compute_sum(w, h, self.t, *self.wave_arrays())
+        computed = time.perf_counter()
+        if self.sum_item is None:
+            self.sum_item = self.canvas.create_line(0, 0, 0, 0, fill=SUM_COLOR, width=2, tags="sum")
+        self.canvas.coords(self.sum_item, coords)
+        done = time.perf_counter()
+        self.record_frame(start, computed, done, len(coords) // 2, self.tk.calls - calls, self.static_items + 1)
+
+    def record_frame(self, start, computed, done, points, tk_calls, items):
+        self.stats.record((computed - start) * 1000, (done - computed) * 1000, points, tk_calls, items)
+        if self.show_hud.get() and done - self._hud_updated > 0.5:
+            self.hud_var.set(self.stats.hud_text())
+            self._hud_updated = done
+
     def draw_all_waves(self):
-        self.canvas.delete("wave")
+        if self.uses_image():
+            self.draw_raster()
+            return
+        if self.view_mode.get() == "sum":
+            self.draw_sum()
+            return
+        if self._store_generation != self.store.generation or len(self.wave_items) != len(self.store):
+            self.sync_wave_items()
+        start = time.perf_counter()
+        calls = self.tk.calls
+        if not self.reuse_wave_items:
+            self.canvas.delete("wave_frame")
         w = self.canvas.winfo_width() or self.canvas.winfo_reqwidth()
-        # Ultra-fine step to capture all oscillations
-        step = 1  # Plot every pixel for maximum detail
-
-        for wave in self.waves:
-            points = [(x, self.generate_wave_y(x, self.t, wave))
-                      for x in range(0, w + 1, step)]
-            flat = [coord for point in points for coord in point]
-            self.canvas.create_line(*flat, fill=wave["color"],
-                                    width=2, tags="wave", smooth=True)
\ No newline at end of file
+        h = self.canvas.winfo_height()
+
+        # Point counts follow each wave's on-screen wavelength, not the canvas width
+        freqs, amps, codes = self.wave_arrays()
+        scroll = self.scroll_render.get()
+        if self.threaded_render.get() and self.running:
+            # Hand this frame to the worker and show the newest one it finished
+            self.frame_worker.start()
+            self.frame_worker.submit(w, h, self.t, freqs, amps, codes, scroll)
+            ready = self.frame_worker.take()
+            if ready is None or len(ready.frames) != len(self.store):
+                return
+            frames = ready.frames
+            computed = time.perf_counter()
+            start = computed - ready.compute_ms / 1000
+        elif self.hub is not None:
+            # Shared with every other view at this size and time
+            frames = self.hub.frame(w, h, self.t, scroll, self.speed.get())
+            computed = time.perf_counter()
+        else:
+            # Scrolling only computes columns scrolled into view since the last frame
+            frames = frame_worker.compute_frame(w, h, self.t, freqs, amps, codes,
+                                                self.wave_rings if scroll else None)
+            computed = time.perf_counter()
+
+        for idx, (coords, smooth) in enumerate(frames):
+            if not self.reuse_wave_items:
+                # Previous delete/recreate path, kept for benchmarking against
+                self.canvas.create_line(coords, fill=self.store.color_of(idx),
+                                        width=2, tags=("wave", "wave_frame"), smooth=smooth)
+                continue
+            item = self.wave_items[idx]
+            self.canvas.coords(item, coords)
+            if self.wave_smooth[idx] != smooth:
+                self.canvas.itemconfig(item, smooth=smooth)
+                self.wave_smooth[idx] = smooth
+        done = time.perf_counter()
+
+        self.record_frame(start, computed, done, sum(len(coords) for coords, _ in frames) // 2,
+                          self.tk.calls - calls, self.static_items + len(frames))
@@ -0,0 +1,104 @@
+import numpy as np
+
+import wave_engine
+
+
+class WaveStore:
+    """
+    Wave parameters as parallel arrays: freq, amp, type code and an index
+    into a palette of distinct colours, about 21 bytes per wave.
+
+    Capacity doubles as waves are added, so bulk loads of thousands of
+    components stay cheap. version changes on every edit, generation only
+    when the list is cleared, so views sharing a store can tell an edit
+    from a replacement.
+    """
+
+    def __init__(self, capacity=16):
+        self.count = 0
+        self.version = 0
+        self.generation = 0
+        self.freq = np.empty(capacity)
+        self.amp = np.empty(capacity)
+        self.code = np.empty(capacity, dtype=np.int8)
+        self.color = np.empty(capacity, dtype=np.int32)
+        self.palette = []
+        self._palette_index = {}
+
+    def __len__(self):
+        return self.count
+
+    def _reserve(self, needed):
+        capacity = len(self.freq)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("freq", "amp", "code", "color"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def _color_id(self, color):
+        idx = self._palette_index.get(color)
+        if idx is None:
+            idx = self._palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        return idx
+
+    def add(self, freq, amp, wave_type, color):
+        return self.extend([{"freq": freq, "amp": amp, "wave_type": wave_type, "color": color}])
+
+    def extend(self, specs):
+        """Append wave dicts (freq, amp, wave_type, color); returns the first new index."""
+        specs = list(specs)
+        first = self.count
+        self._reserve(first + len(specs))
+        end = first + len(specs)
+        self.freq[first:end] = [s["freq"] for s in specs]
+        self.amp[first:end] = [s["amp"] for s in specs]
+        self.code[first:end] = [wave_engine.type_code(s["wave_type"]) for s in specs]
+        self.color[first:end] = [self._color_id(s["color"]) for s in specs]
+        self.count = end
+        self.version += 1
+        return first
+
+    def update(self, idx, freq=None, amp=None, wave_type=None, color=None):
+        if freq is not None:
+            self.freq[idx] = freq
+        if amp is not None:
+            self.amp[idx] = amp
+        if wave_type is not None:
+            self.code[idx] = wave_engine.type_code(wave_type)
+        if color is not None:
+            self.color[idx] = self._color_id(color)
+        self.version += 1
+
+    def clear(self):
+        self.count = 0
+        self.palette.clear()
+        self._palette_index.clear()
+        self.version += 1
+        self.generation += 1
+
+    def arrays(self):
+        """(freqs, amps, codes) views of the live waves."""
+        n = self.count
+        return self.freq[:n], self.amp[:n], self.code[:n]
+
+    def wave_type(self, idx):
+        return wave_engine.WAVE_TYPES[self.code[idx]]
+
+    def color_of(self, idx):
+        return self.palette[self.color[idx]]
+
+    def colors(self):
+        palette = self.palette
+        return [palette[c] for c in self.color[:self.count].tolist()]
+
+    def specs(self):
+        return [{"wave_type": wave_engine.WAVE_TYPES[code], "freq": freq, "amp": amp, "color": color}
+                for freq, amp, code, color in zip(self.freq[:self.count].tolist(),
+                                                  self.amp[:self.count].tolist(),
+                                                  self.code[:self.count].tolist(), self.colors())]